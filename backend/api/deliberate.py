@@ -1,12 +1,12 @@
 """Deliberation SSE endpoint."""
 
 import asyncio
-import json
 import logging
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+from sse_starlette.sse import EventSourceResponse
 
 from backend.lib.llm import LLMClient
 from backend.lib.models import SessionStatus
@@ -15,11 +15,24 @@ from backend.lib.streaming import format_sse
 from backend.orchestrator.engine import DeliberationEngine
 
 HEARTBEAT_INTERVAL = 10  # seconds
+# Heartbeats never change, so the frame is encoded once. NO event field so
+# onmessage receives it.
+HEARTBEAT_FRAME = (
+    b"data: "
+    + orjson.dumps({"event_type": "heartbeat", "message": "Processing..."})
+    + b"\n\n"
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _error_frame(error: BaseException) -> bytes:
+    """Encode an error as an SSE data frame for the client."""
+    payload = {"event_type": "error", "error": str(error), "type": type(error).__name__}
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 @router.get("/deliberate/{session_id}")
 async def deliberate(
     session_id: UUID,
@@ -56,12 +69,6 @@ async def deliberate(
         event_queue: asyncio.Queue = asyncio.Queue()
         engine_task = None
 
-        # Heartbeat as ServerSentEvent - NO event field so onmessage receives it
-        def make_heartbeat() -> ServerSentEvent:
-            return ServerSentEvent(
-                data=json.dumps({'event_type': 'heartbeat', 'message': 'Processing...'})
-            )
-
         async def run_engine():
             """Run the engine and put events on the queue."""
             try:
@@ -103,7 +110,7 @@ async def deliberate(
                 except asyncio.TimeoutError:
                     # Queue.get() timed out - send heartbeat and keep waiting
                     logger.info(f"Sending heartbeat for session {session_id}")
-                    yield make_heartbeat()
+                    yield HEARTBEAT_FRAME
                     continue
 
                 if msg_type == "event":
@@ -128,22 +135,12 @@ async def deliberate(
                     break
 
                 elif msg_type == "error":
-                    error_data = json.dumps({
-                        "event_type": "error",
-                        "error": str(payload),
-                        "type": type(payload).__name__
-                    })
-                    yield ServerSentEvent(data=error_data)
+                    yield _error_frame(payload)
                     break
 
         except Exception as e:
             logger.exception(f"Deliberation error for session {session_id}")
-            error_data = json.dumps({
-                "event_type": "error",
-                "error": str(e),
-                "type": type(e).__name__
-            })
-            yield ServerSentEvent(data=error_data)
+            yield _error_frame(e)
 
         finally:
             if engine_task and not engine_task.done():
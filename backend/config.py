@@ -47,6 +47,7 @@ class ModelConfig(BaseModel):
 
     provider: ModelProvider
     model_id: str
+    timeout_s: float = 90.0
 
 
 # =============================================================================
@@ -147,10 +148,65 @@ class Settings(BaseSettings):
         default=Path("./sessions"), description="Session storage directory"
     )
     session_ttl_hours: int = Field(default=24, description="Session TTL in hours")
+    session_cache_max: int = Field(
+        default=1024, description="Max sessions held in the in-memory cache"
+    )
+    session_pretty_json: bool = Field(
+        default=False, description="Indent session files (debugging aid)"
+    )
+    session_flush_interval: float = Field(
+        default=0.2, description="Seconds to coalesce session saves before writing"
+    )
+    session_durable_writes: bool = Field(
+        default=False, description="fsync session files before replacing them"
+    )
+    session_write_attempts: int = Field(
+        default=5, description="Failed writes of one save before it is dropped"
+    )
 
     # Deliberation settings
     max_rounds: int = Field(default=3, description="Maximum deliberation rounds")
 
+    # Provider settings
+    max_concurrent_per_provider: dict[str, int] = Field(
+        default_factory=lambda: {"anthropic": 8, "openai": 8, "openrouter": 4},
+        description="Max in-flight LLM calls per provider",
+    )
+    openrouter_transport: Literal["httpx", "aiohttp"] = Field(
+        default="httpx",
+        description="HTTP library for OpenRouter calls (aiohttp needs the aiohttp extra)",
+    )
+    llm_connect_timeout: float = Field(default=5.0, description="LLM connect timeout (s)")
+    llm_read_timeout_chat: float = Field(
+        default=60.0, description="Read timeout for non-streaming LLM calls (s)"
+    )
+    llm_read_timeout_stream: float = Field(
+        default=300.0, description="Read timeout between streamed LLM chunks (s)"
+    )
+
+    # Response cache (temperature-0 completions only)
+    response_cache_enabled: bool = Field(
+        default=False, description="Replay identical deterministic completions from disk"
+    )
+    response_cache_ttl: float = Field(
+        default=3600.0, description="Response cache entry lifetime (s)"
+    )
+    response_cache_path: Path = Field(
+        default=Path("./.cache/llm_responses.sqlite"),
+        description="SQLite file backing the response cache",
+    )
+
+    # Streaming settings
+    stream_coalesce_max_chunks: int = Field(
+        default=32, description="Max provider deltas merged into one stream chunk"
+    )
+    stream_coalesce_max_delay: float = Field(
+        default=0.02, description="Max seconds to buffer deltas before flushing"
+    )
+    stream_coalesce_max_chars: int = Field(
+        default=64, description="Flush buffered deltas once this many characters accumulate"
+    )
+
     # Model overrides
     moderator_model: str = Field(
         default=ModelType.CLAUDE_OPUS.value,
@@ -167,7 +223,7 @@ class Settings(BaseSettings):
         description="Default violence detail level",
     )
 
-    @field_validator("session_dir", mode="before")
+    @field_validator("session_dir", "response_cache_path", mode="before")
     @classmethod
     def ensure_path(cls, v: str | Path) -> Path:
         """Convert string to Path."""
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from backend.config import ModelType
 from backend.lib.exceptions import ExpertError, JurisdictionError, LLMResponseParseError
 from backend.lib.llm import LLMClient
@@ -24,6 +26,9 @@ from backend.lib.utils import enum_value
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole delta_requests array in one pydantic-core call
+_DELTA_REQUESTS = TypeAdapter(list[DeltaRequest])
+
 
 # =============================================================================
 # Configuration Dataclasses
@@ -394,16 +399,9 @@ class Expert(ABC):
             parsed = self._parse_response(response.content)
 
             # Build contribution
-            delta_requests = []
-            for dr in parsed.get("delta_requests", []):
-                delta_requests.append(
-                    DeltaRequest(
-                        field=dr.get("field", ""),
-                        operation=dr.get("operation", "set"),
-                        value=dr.get("value"),
-                        rationale=dr.get("rationale", ""),
-                    )
-                )
+            delta_requests = _DELTA_REQUESTS.validate_python(
+                parsed.get("delta_requests", [])
+            )
 
             # Validate deltas
             delta_requests = self._validate_deltas(delta_requests)
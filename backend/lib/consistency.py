@@ -9,6 +9,10 @@ Validates ScenarioSheet for internal consistency including:
 """
 
 import re
+import sys
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
 from backend.lib.defaults import (
@@ -19,6 +23,65 @@ from backend.lib.defaults import (
 )
 from backend.lib.models import ConsistencyViolation, ScenarioSheet
 
+# Interned severity and violation type strings shared by every violation.
+# Compare with ==, never `is`: violations built elsewhere (JSON, callers) hold
+# their own strings; == still short-circuits on identity for these.
+_SEV_ERROR = sys.intern("error")
+_SEV_WARNING = sys.intern("warning")
+_VTYPES: dict[str, str] = {
+    name: sys.intern(name)
+    for name in (
+        "temporal_paradox",
+        "causal_cycle",
+        "force_count_mismatch",
+        "negative_count",
+        "invalid_percentage",
+        "terrain_weather_mismatch",
+        "terrain_ground_mismatch",
+        "fog_of_war_violation",
+        "anachronism",
+    )
+}
+
+ConsistencyCheck = Callable[[ScenarioSheet], Iterable[ConsistencyViolation]]
+
+# Registered checks, run in registration order by check_all_consistency
+_CHECKS: list[ConsistencyCheck] = []
+
+
+def register_check(check: ConsistencyCheck) -> ConsistencyCheck:
+    """Register a consistency check (usable as a decorator)."""
+    _CHECKS.append(check)
+    return check
+
+
+@dataclass
+class ViolationReport:
+    """Result of a full consistency pass with precomputed severity counts."""
+
+    violations: list[ConsistencyViolation] = field(default_factory=list)
+    error_count: int = 0
+    warning_count: int = 0
+
+    def add(self, violation: ConsistencyViolation) -> None:
+        """Append a violation and update the severity counts."""
+        self.violations.append(violation)
+        if violation.severity == _SEV_ERROR:
+            self.error_count += 1
+        else:
+            self.warning_count += 1
+
+    def extend(self, violations: Iterable[ConsistencyViolation]) -> None:
+        """Append several violations and update the severity counts."""
+        for violation in violations:
+            self.add(violation)
+
+    def __iter__(self) -> Iterator[ConsistencyViolation]:
+        return iter(self.violations)
+
+    def __len__(self) -> int:
+        return len(self.violations)
+
 
 def _get_attr(obj: Any, attr: str, default: Any = None) -> Any:
     """Safely get attribute from dict or model object."""
@@ -27,6 +90,7 @@ def _get_attr(obj: Any, attr: str, default: Any = None) -> Any:
     return getattr(obj, attr, default)
 
 
+@register_check
 def check_timeline_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
     """
     Check timeline for logical paradoxes.
@@ -35,56 +99,77 @@ def check_timeline_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolatio
     - Events have valid timestamps
     - Causal ordering makes sense
     - No circular dependencies
+
+    triggered_by links form a cause -> effect graph. Every edge is checked
+    for temporal ordering, and Kahn's topological sort detects cycles in
+    one pass over the graph.
     """
     violations = []
 
     if not sheet.timeline:
         return violations
 
-    # Parse timestamps to relative minutes for comparison
-    timestamp_order: list[tuple[int, str, int]] = []
-
-    for idx, event in enumerate(sheet.timeline):
-        timestamp = _get_attr(event, "timestamp", "")
+    event_times: dict[str, int | None] = {}
+    for event in sheet.timeline:
         event_name = _get_attr(event, "event", "")
-        minutes = _parse_timestamp(timestamp)
-        if minutes is not None:
-            timestamp_order.append((minutes, event_name, idx))
+        event_times[event_name] = _parse_timestamp(_get_attr(event, "timestamp", ""))
 
-    # Sort by time and check for issues
-    timestamp_order.sort(key=lambda x: x[0])
-
-    # Check that triggered_by events happen before their effects
-    event_times = {
-        _get_attr(event, "event", ""): _parse_timestamp(_get_attr(event, "timestamp", ""))
-        for event in sheet.timeline
-    }
+    # Build cause -> effect adjacency with in-degree counts
+    graph: dict[str, list[str]] = defaultdict(list)
+    in_degree: dict[str, int] = dict.fromkeys(event_times, 0)
 
     for event in sheet.timeline:
         triggered_by = _get_attr(event, "triggered_by", "")
         event_name = _get_attr(event, "event", "")
-        if triggered_by and triggered_by in event_times:
-            trigger_time = event_times[triggered_by]
-            event_time = event_times.get(event_name)
+        if not triggered_by or triggered_by not in event_times:
+            continue
 
-            if trigger_time is not None and event_time is not None:
-                if trigger_time >= event_time:
-                    violations.append(
-                        ConsistencyViolation(
-                            field="timeline",
-                            violation_type="temporal_paradox",
-                            description=(
-                                f"Event '{event_name}' is triggered by '{triggered_by}' "
-                                f"but occurs at same time or earlier"
-                            ),
-                            severity="error",
-                            suggestion="Adjust timestamps so cause precedes effect",
-                        )
+        graph[triggered_by].append(event_name)
+        in_degree[event_name] += 1
+
+        # Check that triggered_by events happen before their effects
+        trigger_time = event_times[triggered_by]
+        event_time = event_times[event_name]
+        if trigger_time is not None and event_time is not None:
+            if trigger_time >= event_time:
+                violations.append(
+                    ConsistencyViolation.model_construct(
+                        field="timeline",
+                        violation_type=_VTYPES["temporal_paradox"],
+                        description=(
+                            f"Event '{event_name}' is triggered by '{triggered_by}' "
+                            f"but occurs at same time or earlier"
+                        ),
+                        severity=_SEV_ERROR,
+                        suggestion="Adjust timestamps so cause precedes effect",
                     )
+                )
+
+    # Kahn's algorithm - any event left with in-degree > 0 sits on a cycle
+    queue = deque(name for name, degree in in_degree.items() if degree == 0)
+    while queue:
+        cause = queue.popleft()
+        for effect in graph.get(cause, ()):
+            in_degree[effect] -= 1
+            if in_degree[effect] == 0:
+                queue.append(effect)
+
+    cyclic = [name for name, degree in in_degree.items() if degree > 0]
+    for cycle in _find_cycle_paths(graph, cyclic):
+        violations.append(
+            ConsistencyViolation.model_construct(
+                field="timeline",
+                violation_type=_VTYPES["causal_cycle"],
+                description=f"Events trigger each other in a cycle: {' -> '.join(cycle)}",
+                severity=_SEV_ERROR,
+                suggestion="Break the cycle so every event has a cause that precedes it",
+            )
+        )
 
     return violations
 
 
+@register_check
 def check_force_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
     """
     Check force numbers are internally consistent.
@@ -106,14 +191,14 @@ def check_force_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
             unit_sum = sum(_get_attr(unit, "count", 0) for unit in composition)
             if unit_sum != total_strength:
                 violations.append(
-                    ConsistencyViolation(
+                    ConsistencyViolation.model_construct(
                         field=f"forces.{side_id}",
-                        violation_type="force_count_mismatch",
+                        violation_type=_VTYPES["force_count_mismatch"],
                         description=(
                             f"Unit counts sum to {unit_sum} but total_strength is "
                             f"{total_strength}"
                         ),
-                        severity="error",
+                        severity=_SEV_ERROR,
                         suggestion=(
                             f"Either adjust unit counts or set total_strength to {unit_sum}"
                         ),
@@ -126,11 +211,11 @@ def check_force_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
                 unit_type = _get_attr(unit, "unit_type", "unknown")
                 if unit_count < 0:
                     violations.append(
-                        ConsistencyViolation(
+                        ConsistencyViolation.model_construct(
                             field=f"forces.{side_id}.composition",
-                            violation_type="negative_count",
+                            violation_type=_VTYPES["negative_count"],
                             description=f"Unit '{unit_type}' has negative count: {unit_count}",
-                            severity="error",
+                            severity=_SEV_ERROR,
                             suggestion="Unit counts must be non-negative",
                         )
                     )
@@ -144,22 +229,22 @@ def check_force_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
         loser_casualties = _get_attr(sheet.casualty_profile, "loser_casualties_percent", 0)
         if winner_casualties > 100:
             violations.append(
-                ConsistencyViolation(
+                ConsistencyViolation.model_construct(
                     field="casualty_profile.winner_casualties_percent",
-                    violation_type="invalid_percentage",
+                    violation_type=_VTYPES["invalid_percentage"],
                     description="Winner casualties exceed 100%",
-                    severity="error",
+                    severity=_SEV_ERROR,
                     suggestion="Casualty percentages must be between 0 and 100",
                 )
             )
 
         if loser_casualties > 100:
             violations.append(
-                ConsistencyViolation(
+                ConsistencyViolation.model_construct(
                     field="casualty_profile.loser_casualties_percent",
-                    violation_type="invalid_percentage",
+                    violation_type=_VTYPES["invalid_percentage"],
                     description="Loser casualties exceed 100%",
-                    severity="error",
+                    severity=_SEV_ERROR,
                     suggestion="Casualty percentages must be between 0 and 100",
                 )
             )
@@ -167,6 +252,7 @@ def check_force_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
     return violations
 
 
+@register_check
 def check_geography_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
     """
     Check geography and distances match march rates.
@@ -191,22 +277,22 @@ def check_geography_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolati
     # Simple heuristic checks
     if terrain_type == "desert" and weather in ["snow", "heavy_rain"]:
         violations.append(
-            ConsistencyViolation(
+            ConsistencyViolation.model_construct(
                 field="terrain_weather",
-                violation_type="terrain_weather_mismatch",
+                violation_type=_VTYPES["terrain_weather_mismatch"],
                 description=f"Desert terrain with {weather} weather is unusual",
-                severity="warning",
+                severity=_SEV_WARNING,
                 suggestion="Consider if this weather pattern is intentional for the scenario",
             )
         )
 
     if terrain_type == "marsh" and ground_conditions == "firm":
         violations.append(
-            ConsistencyViolation(
+            ConsistencyViolation.model_construct(
                 field="terrain_weather",
-                violation_type="terrain_ground_mismatch",
+                violation_type=_VTYPES["terrain_ground_mismatch"],
                 description="Marsh terrain with firm ground conditions is contradictory",
-                severity="warning",
+                severity=_SEV_WARNING,
                 suggestion="Marsh terrain typically has soft/muddy ground",
             )
         )
@@ -214,6 +300,7 @@ def check_geography_consistency(sheet: ScenarioSheet) -> list[ConsistencyViolati
     return violations
 
 
+@register_check
 def check_commander_knowledge(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
     """
     Check that commander knowledge respects fog of war.
@@ -232,14 +319,14 @@ def check_commander_knowledge(sheet: ScenarioSheet) -> list[ConsistencyViolation
         for missing in info_missing:
             if missing.lower() in rationale.lower():
                 violations.append(
-                    ConsistencyViolation(
+                    ConsistencyViolation.model_construct(
                         field="decision_points",
-                        violation_type="fog_of_war_violation",
+                        violation_type=_VTYPES["fog_of_war_violation"],
                         description=(
                             f"Decision point for {commander} references "
                             f"'{missing}' in rationale but it's listed as unknown"
                         ),
-                        severity="warning",
+                        severity=_SEV_WARNING,
                         suggestion="Commander cannot act on information they don't have",
                     )
                 )
@@ -247,6 +334,7 @@ def check_commander_knowledge(sheet: ScenarioSheet) -> list[ConsistencyViolation
     return violations
 
 
+@register_check
 def check_anachronisms(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
     """
     Check for era-inappropriate elements.
@@ -264,7 +352,7 @@ def check_anachronisms(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
         return violations  # Fantasy or unknown era, skip checks
 
     constraints = ERA_CONSTRAINTS[era]
-    forbidden = constraints.get("forbidden", [])
+    forbidden = constraints.get("forbidden", ())
 
     # Check force equipment
     for side_id, force in sheet.forces.items():
@@ -276,14 +364,14 @@ def check_anachronisms(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
             for forbidden_item in forbidden:
                 if forbidden_item.lower() in unit_type.lower():
                     violations.append(
-                        ConsistencyViolation(
+                        ConsistencyViolation.model_construct(
                             field=f"forces.{side_id}.composition",
-                            violation_type="anachronism",
+                            violation_type=_VTYPES["anachronism"],
                             description=(
                                 f"Unit type '{unit_type}' references "
                                 f"'{forbidden_item}' which is anachronistic for {era} era"
                             ),
-                            severity="error",
+                            severity=_SEV_ERROR,
                             suggestion=f"Remove or replace {forbidden_item} with period-appropriate alternative",
                         )
                     )
@@ -293,13 +381,13 @@ def check_anachronisms(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
                 for forbidden_item in forbidden:
                     if forbidden_item.lower() in equip.lower():
                         violations.append(
-                            ConsistencyViolation(
+                            ConsistencyViolation.model_construct(
                                 field=f"forces.{side_id}.composition",
-                                violation_type="anachronism",
+                                violation_type=_VTYPES["anachronism"],
                                 description=(
                                     f"Equipment '{equip}' is anachronistic for {era} era"
                                 ),
-                                severity="error",
+                                severity=_SEV_ERROR,
                                 suggestion=f"Replace with period-appropriate equipment",
                             )
                         )
@@ -309,27 +397,28 @@ def check_anachronisms(sheet: ScenarioSheet) -> list[ConsistencyViolation]:
 
 def check_all_consistency(
     sheet: ScenarioSheet,
-) -> list[ConsistencyViolation]:
+) -> ViolationReport:
     """
     Run all consistency checks on a ScenarioSheet.
 
     Returns:
-        List of all violations found
+        ViolationReport with all violations found and their severity counts
     """
-    violations = []
+    report = ViolationReport()
 
-    violations.extend(check_timeline_consistency(sheet))
-    violations.extend(check_force_consistency(sheet))
-    violations.extend(check_geography_consistency(sheet))
-    violations.extend(check_commander_knowledge(sheet))
-    violations.extend(check_anachronisms(sheet))
+    for check in _CHECKS:
+        report.extend(check(sheet))
 
-    return violations
+    return report
 
 
-def has_blocking_violations(violations: list[ConsistencyViolation]) -> bool:
+def has_blocking_violations(
+    violations: ViolationReport | list[ConsistencyViolation],
+) -> bool:
     """Check if any violations are blocking (errors)."""
-    return any(v.severity == "error" for v in violations)
+    if isinstance(violations, ViolationReport):
+        return violations.error_count > 0
+    return any(v.severity == _SEV_ERROR for v in violations)
 
 
 def filter_violations_by_severity(
@@ -345,6 +434,52 @@ def filter_violations_by_severity(
 # =============================================================================
 
 
+def _find_cycle_paths(graph: dict[str, list[str]], nodes: list[str]) -> list[list[str]]:
+    """
+    Find causal cycle paths among nodes left over by the topological sort.
+
+    Runs an iterative DFS that tracks the current path, so each back edge
+    yields the full cycle (e.g. ["a", "b", "a"]). Nodes are visited in the
+    given order, keeping the reported cycles deterministic.
+    """
+    candidates = set(nodes)
+    on_path: set[str] = set()
+    done: set[str] = set()
+    seen_cycles: set[frozenset[str]] = set()
+    cycles: list[list[str]] = []
+
+    for start in nodes:
+        if start in done:
+            continue
+
+        path = [start]
+        on_path.add(start)
+        stack = [iter(graph.get(start, ()))]
+
+        while stack:
+            for child in stack[-1]:
+                if child not in candidates or child in done:
+                    continue
+                if child in on_path:
+                    cycle = path[path.index(child):] + [child]
+                    key = frozenset(cycle)
+                    if key not in seen_cycles:
+                        seen_cycles.add(key)
+                        cycles.append(cycle)
+                    continue
+                path.append(child)
+                on_path.add(child)
+                stack.append(iter(graph.get(child, ())))
+                break
+            else:
+                node = path.pop()
+                on_path.discard(node)
+                done.add(node)
+                stack.pop()
+
+    return cycles
+
+
 def _parse_timestamp(timestamp: str) -> int | None:
     """
     Parse a relative timestamp string to minutes.
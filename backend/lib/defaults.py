@@ -4,6 +4,9 @@ These tables codify reasonable defaults so the system stays internally consisten
 Values are based on historical military data and academic sources.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TypeAlias
 
 # Type aliases for clarity
@@ -143,86 +146,91 @@ ENDURANCE: dict[str, RangeTuple] = {
 # Era Constraints (Anachronism Detection)
 # =============================================================================
 
-ERA_CONSTRAINTS: dict[str, dict[str, list[str]]] = {
+_ERA_CONSTRAINTS: dict[str, dict[str, tuple[str, ...] | str]] = {
     "ancient": {
-        "allowed_weapons": [
+        "allowed_weapons": (
             "sword", "spear", "javelin", "bow", "sling", "dagger",
             "axe", "mace", "pike", "sarissa", "gladius", "pilum",
-        ],
-        "allowed_armor": [
+        ),
+        "allowed_armor": (
             "leather", "linen", "bronze", "iron", "mail", "scale",
             "lorica segmentata", "linothorax", "muscle cuirass",
-        ],
-        "forbidden": [
+        ),
+        "forbidden": (
             "crossbow", "plate armor", "longbow", "gunpowder", "cannon",
             "pike and shot", "musket", "arquebus", "stirrups",
-        ],
+        ),
         "notes": "Pre-500 CE. No stirrups until late period.",
     },
     "early_medieval": {
-        "allowed_weapons": [
+        "allowed_weapons": (
             "sword", "spear", "axe", "bow", "seax", "francisca",
             "scramasax", "lance", "javelin", "mace", "flail",
-        ],
-        "allowed_armor": [
+        ),
+        "allowed_armor": (
             "mail", "scale", "leather", "gambeson", "helm", "shield",
             "lamellar",
-        ],
-        "forbidden": [
+        ),
+        "forbidden": (
             "plate armor", "longbow", "crossbow (early)", "gunpowder",
             "full plate", "tournament armor",
-        ],
+        ),
         "notes": "500-1000 CE. Stirrups arrive mid-period. Limited crossbow.",
     },
     "high_medieval": {
-        "allowed_weapons": [
+        "allowed_weapons": (
             "sword", "lance", "mace", "flail", "crossbow", "longbow",
             "poleaxe", "halberd", "morning star", "war hammer",
-        ],
-        "allowed_armor": [
+        ),
+        "allowed_armor": (
             "mail", "coat of plates", "early plate", "great helm",
             "gambeson", "surcoat",
-        ],
-        "forbidden": [
+        ),
+        "forbidden": (
             "gunpowder", "cannon", "arquebus", "musket", "full plate",
-        ],
+        ),
         "notes": "1000-1300 CE. Crossbow common. Plate developing.",
     },
     "late_medieval": {
-        "allowed_weapons": [
+        "allowed_weapons": (
             "sword", "lance", "poleaxe", "longbow", "crossbow",
             "early cannon", "hand cannon", "pike", "bill", "halberd",
-        ],
-        "allowed_armor": [
+        ),
+        "allowed_armor": (
             "full plate", "brigandine", "mail", "sallet", "armet",
             "tournament armor",
-        ],
-        "forbidden": [
+        ),
+        "forbidden": (
             "musket", "arquebus (late only)", "rifle", "bayonet",
-        ],
+        ),
         "notes": "1300-1500 CE. Gunpowder emerges. Full plate common.",
     },
     "renaissance": {
-        "allowed_weapons": [
+        "allowed_weapons": (
             "pike", "arquebus", "sword", "rapier", "halberd",
             "cannon", "musket", "pistol", "lance",
-        ],
-        "allowed_armor": [
+        ),
+        "allowed_armor": (
             "plate", "morion", "burgonet", "cuirass", "buff coat",
-        ],
-        "forbidden": [
+        ),
+        "forbidden": (
             "rifle", "bayonet", "flintlock",
-        ],
+        ),
         "notes": "1500-1600 CE. Pike and shot era. Cavalry transitioning.",
     },
     "fantasy": {
-        "allowed_weapons": ["any"],
-        "allowed_armor": ["any"],
-        "forbidden": [],
+        "allowed_weapons": ("any",),
+        "allowed_armor": ("any",),
+        "forbidden": (),
         "notes": "Fantasy settings allow anachronisms if internally consistent.",
     },
 }
 
+# Read-only view so the tables can be shared freely and used in cached lookups
+ERA_CONSTRAINTS: Mapping[str, Mapping[str, tuple[str, ...] | str]] = MappingProxyType(
+    {era: MappingProxyType(values) for era, values in _ERA_CONSTRAINTS.items()}
+)
+
 
 # =============================================================================
 # Formation Depths
@@ -293,16 +301,29 @@ SUPPLY_CONSUMPTION: dict[str, float] = {
 # =============================================================================
 
 
+# Direct-key lookup tables for the helpers below
+_CONDITION_RATES: dict[str, RangeTuple] = {
+    "mud": MARCH_RATES["mud_conditions"],
+    "mountain": MARCH_RATES["mountain_terrain"],
+    "forest": MARCH_RATES["forest_terrain"],
+}
+_DEFAULT_MARCH_RATE = MARCH_RATES["mixed_army"]
+
+_METHOD_RATES: dict[str, float] = {
+    "mounted_courier": MESSAGE_LATENCY["mounted_courier_km"],
+    "runner": MESSAGE_LATENCY["runner_km"],
+    "relay_runner": MESSAGE_LATENCY["relay_runner_km"],
+}
+_DEFAULT_METHOD_RATE = _METHOD_RATES["runner"]
+_INTERPRET_DELAY = MESSAGE_LATENCY["interpret_signal"]
+
+
 def get_march_rate(unit_type: str, conditions: str = "normal") -> RangeTuple:
     """Get march rate for unit type with conditions modifier."""
-    base = MARCH_RATES.get(unit_type, MARCH_RATES["mixed_army"])
-    if conditions == "mud":
-        return MARCH_RATES["mud_conditions"]
-    if conditions == "mountain":
-        return MARCH_RATES["mountain_terrain"]
-    if conditions == "forest":
-        return MARCH_RATES["forest_terrain"]
-    return base
+    condition_rate = _CONDITION_RATES.get(conditions)
+    if condition_rate is not None:
+        return condition_rate
+    return MARCH_RATES.get(unit_type, _DEFAULT_MARCH_RATE)
 
 
 def get_casualty_range(outcome: str) -> RangeTuple:
@@ -316,24 +337,23 @@ def calculate_frontage(unit_type: str, count: int) -> float:
     return count * per_man
 
 
+@lru_cache(maxsize=1024)
 def is_anachronistic(era: str, item: str, item_type: str = "weapons") -> bool:
     """Check if an item is anachronistic for an era."""
     if era not in ERA_CONSTRAINTS:
         return False
     constraints = ERA_CONSTRAINTS[era]
     if item_type == "weapons":
-        forbidden = constraints.get("forbidden", [])
+        forbidden = constraints.get("forbidden", ())
         return any(f.lower() in item.lower() for f in forbidden)
     return False
 
 
 def get_message_time(distance_km: float, method: str = "mounted_courier") -> float:
     """Calculate message delivery time in minutes."""
-    rate_key = f"{method}_km"
-    rate = MESSAGE_LATENCY.get(rate_key, MESSAGE_LATENCY["runner_km"])
-    base_time = distance_km * rate
+    rate = _METHOD_RATES.get(method, _DEFAULT_METHOD_RATE)
     # Add interpretation delay
-    return base_time + MESSAGE_LATENCY["interpret_signal"]
+    return distance_km * rate + _INTERPRET_DELAY
 
 
 def get_combat_duration(intensity: str = "sustained") -> RangeTuple:
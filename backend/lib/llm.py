@@ -5,14 +5,23 @@ Routes requests based on MODEL_ASSIGNMENTS configuration.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, AsyncIterator
-
+import random
+import re
+import time
+from collections.abc import AsyncGenerator
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, NoReturn, Required, TypedDict
+
+import anthropic
 import httpx
+import openai
+import orjson
 from anthropic import AsyncAnthropic
 from openai import AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from backend.config import (
     MODEL_ASSIGNMENTS,
@@ -26,13 +35,327 @@ from backend.lib.exceptions import (
     LLMAuthenticationError,
     LLMConnectionError,
     LLMContextLengthError,
+    LLMError,
     LLMRateLimitError,
     LLMResponseParseError,
 )
 from backend.lib.models import ExpertContribution, TokenUsage
+from backend.lib.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Characters that matter when scanning for the end of a JSON object
+_JSON_STRUCTURAL = re.compile(r'[{}"\\]')
+
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Prompt caching beta header (GA in newer SDKs, harmless to send)
+ANTHROPIC_CACHE_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Server-sent event framing
+_SSE_DATA = b"data:"
+_SSE_DATA_LEN = len(_SSE_DATA)
+_SSE_DONE = b"[DONE]"
+
+
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+
+
+# Pooled connections belong to the event loop that opened them, so each
+# running loop gets its own pool (e.g. a second loop in a test runner would
+# otherwise reuse the first loop's dead connections)
+_shared_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_shared_aiohttp_sessions: dict[asyncio.AbstractEventLoop, "aiohttp.ClientSession"] = {}
+
+
+def _prune_closed_loops(registry: dict[asyncio.AbstractEventLoop, Any]) -> None:
+    """Forget per-loop entries whose event loop has been closed."""
+    for loop in [loop for loop in registry if loop.is_closed()]:
+        del registry[loop]
+
+
+async def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client for the running event loop.
+
+    Every LLMClient shares one connection pool so keep-alive connections
+    (and HTTP/2 streams) are reused across requests and client instances.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_http_clients.get(loop)
+    if client is None or client.is_closed:
+        # No await between the check and the store, so no lock is needed
+        _prune_closed_loops(_shared_http_clients)
+        # Pool settings live on the transport, which also retries
+        # failed connection attempts (never sent requests)
+        client = _shared_http_clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=60,
+                ),
+                retries=2,
+            ),
+        )
+    return client
+
+
+async def get_shared_aiohttp_session() -> "aiohttp.ClientSession":
+    """
+    Get the aiohttp session for the running loop (OpenRouter transport).
+
+    Only used when settings.openrouter_transport is "aiohttp". aiohttp is an
+    optional extra and is imported here so the default transport never needs it.
+    """
+    loop = asyncio.get_running_loop()
+    session = _shared_aiohttp_sessions.get(loop)
+    if session is None or session.closed:
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "openrouter_transport='aiohttp' requires the aiohttp extra "
+                "(pip install 'consilium[aiohttp]')"
+            ) from e
+        _prune_closed_loops(_shared_aiohttp_sessions)
+        session = _shared_aiohttp_sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=100,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+        )
+    return session
+
+
+async def close_shared_http_client() -> None:
+    """Close the running loop's HTTP client (and aiohttp session, if opened)."""
+    loop = asyncio.get_running_loop()
+    client = _shared_http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    session = _shared_aiohttp_sessions.pop(loop, None)
+    if session is not None:
+        await session.close()
+
+
+# Expert system prompts are fixed per expert, so each distinct prompt is
+# wrapped once and the same objects are sent every round. Identical objects
+# serialize to identical bytes, which is what provider prompt caches key on.
+# Callers must treat the returned structures as read-only.
+
+
+# Anthropic allows 4 cache breakpoints per request; one is kept for messages
+_MAX_SYSTEM_CACHE_BLOCKS = 3
+
+
+@lru_cache(maxsize=64)
+def _anthropic_system_blocks(
+    system: str, breakpoints: tuple[int, ...] = ()
+) -> tuple[dict[str, Any], ...]:
+    """
+    Cacheable Anthropic system blocks for a prompt.
+
+    breakpoints are character offsets that end a block, so a long prompt can
+    be cached in layers (e.g. persona, then shared scenario context). Every
+    block carries cache_control; offsets past the block limit are ignored.
+    """
+    ends = [b for b in sorted(set(breakpoints)) if 0 < b < len(system)]
+    ends = ends[: _MAX_SYSTEM_CACHE_BLOCKS - 1] + [len(system)]
+    blocks = []
+    start = 0
+    for end in ends:
+        blocks.append(
+            {
+                "type": "text",
+                "text": system[start:end],
+                "cache_control": {"type": "ephemeral"},
+            }
+        )
+        start = end
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=64)
+def _system_message(system: str) -> dict[str, str]:
+    """Chat-completions system message for a prompt."""
+    return {"role": "system", "content": system}
+
+
+@lru_cache(maxsize=64)
+def _static_context_message(static_context: str) -> dict[str, str]:
+    """User message carrying pinned per-session context."""
+    return {"role": "user", "content": static_context}
+
+
+@lru_cache(maxsize=64)
+def _cached_static_context_message(static_context: str) -> dict[str, Any]:
+    """Static context as a content block with an explicit cache breakpoint."""
+    return {
+        "role": "user",
+        "content": [
+            {
+                "type": "text",
+                "text": static_context,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+    }
+
+
+# Gemini won't cache a prefix under ~2048 tokens; ~4 characters per token
+_GEMINI_MIN_CACHE_CHARS = 2048 * 4
+
+
+def _with_static_context(
+    static_context: str | None,
+    messages: list[dict[str, Any]],
+    explicit_cache: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Pin static context ahead of the rolling conversation.
+
+    With explicit_cache the context carries its own cache_control breakpoint,
+    for OpenRouter models that only cache on request (Gemini).
+    """
+    if not static_context:
+        return messages
+    if explicit_cache:
+        return [_cached_static_context_message(static_context), *messages]
+    return [_static_context_message(static_context), *messages]
+
+
+def _with_persistent_context(
+    system: str | None,
+    persistent_context: str | None,
+    cache_breakpoints: list[int] | None,
+) -> tuple[str | None, list[int] | None]:
+    """
+    Append persistent context to the system prompt as its own cached layer.
+
+    The persona stays the first block and the persistent context the next,
+    so changing one doesn't evict the other from the Anthropic cache.
+    """
+    if not persistent_context:
+        return system, cache_breakpoints
+    if not system:
+        return persistent_context, cache_breakpoints
+    return f"{system}\n\n{persistent_context}", [*(cache_breakpoints or ()), len(system)]
+
+
+def _with_dynamic_context(
+    messages: list[dict[str, Any]], dynamic_context: str | None
+) -> list[dict[str, Any]]:
+    """
+    Add per-call context after everything that can be cached.
+
+    It is folded into a trailing plain-text user turn so the turn before it
+    keeps its Anthropic cache breakpoint; otherwise it becomes a new user
+    message.
+    """
+    if not dynamic_context:
+        return messages
+    if messages:
+        last = messages[-1]
+        if last.get("role") == "user" and isinstance(last.get("content"), str):
+            merged = {**last, "content": f"{last['content']}\n\n{dynamic_context}"}
+            return [*messages[:-1], merged]
+    return [*messages, {"role": "user", "content": dynamic_context}]
+
+
+def _wants_explicit_cache(model: str, static_context: str | None) -> bool:
+    """Whether an OpenRouter model needs static context marked for caching."""
+    return (
+        static_context is not None
+        and model.startswith("google/")
+        and len(static_context) >= _GEMINI_MIN_CACHE_CHARS
+    )
+
+
+def _build_cacheable_messages(
+    system: str | None, messages: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    Chat-completions message list ordered for implicit prefix caching.
+
+    Order is system prompt -> pinned static context -> rolling dialogue.
+    OpenAI/OpenRouter only reuse an exact shared prefix, so anything ahead
+    of the cache boundary (the first per-turn message) must be byte-identical
+    between calls: pass scenario context via static_context on
+    complete()/stream(), never mutate it, and keep volatile deltas in the
+    trailing messages.
+    """
+    # -- cache boundary: everything after the system message may vary --
+    return [_system_message(system), *messages] if system else messages
+
+
+async def _aiter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Yield the data payload of each server-sent event in a byte stream.
+
+    Every complete line in a network read is handled in one pass with no str
+    decode. Data lines accumulate until the blank line that ends the event,
+    and multi-line data is joined with newlines as the SSE spec requires.
+    Comments, event/id fields and keep-alives are skipped.
+    """
+    buffer = bytearray()
+    data: list[bytes] = []
+    async for raw in chunks:
+        buffer += raw
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            continue
+        lines = buffer[:end].split(b"\n")
+        del buffer[: end + 1]
+
+        for line in lines:
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                if data:
+                    yield data[0] if len(data) == 1 else b"\n".join(data)
+                    data = []
+            elif line.startswith(_SSE_DATA):
+                # One optional space after the colon
+                start = _SSE_DATA_LEN + (line[_SSE_DATA_LEN:_SSE_DATA_LEN + 1] == b" ")
+                data.append(bytes(line[start:]))
+
+    # Be lenient about a final event missing its terminating blank line
+    if buffer.startswith(_SSE_DATA):
+        start = _SSE_DATA_LEN + (buffer[_SSE_DATA_LEN:_SSE_DATA_LEN + 1] == b" ")
+        data.append(bytes(buffer[start:].rstrip(b"\r")))
+    if data:
+        yield b"\n".join(data)
+
+
+def _model_id(model: str | ModelType) -> str:
+    """Model string for a ModelType or plain model id."""
+    # Exact class check is cheaper than isinstance; enums with members are final
+    return model.value if model.__class__ is ModelType else model
+
+
+def _build_sdk_client(sdk_cls: type, api_key: str, http_client: httpx.AsyncClient) -> Any:
+    """
+    Build a provider SDK client on the shared pool when the SDK allows it.
+
+    SDK releases built on their own HTTP stack reject httpx clients with a
+    TypeError; those fall back to the SDK's internal pool.
+    """
+    try:
+        return sdk_cls(api_key=api_key, http_client=http_client)
+    except TypeError:
+        logger.debug(f"{sdk_cls.__name__} rejected the shared HTTP client; using its own")
+        return sdk_cls(api_key=api_key)
+
 
 # =============================================================================
 # Response Models
@@ -42,20 +365,317 @@ logger = logging.getLogger(__name__)
 class LLMResponse(BaseModel):
     """Unified response from LLM."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     content: str
     token_usage: TokenUsage
     model: str
     finish_reason: str | None = None
 
 
+class CompleteCall(TypedDict, total=False):
+    """Keyword arguments for one LLMClient.complete() call in a batch."""
+
+    model: Required[str | ModelType]
+    messages: Required[list[dict[str, Any]]]
+    system: str | None
+    max_tokens: int
+    temperature: float
+    retries: int
+    retry_delay: float
+    expert: str | None
+    timeout: float | None
+    cache_breakpoints: list[int] | None
+    static_context: str | None
+    persistent_context: str | None
+    dynamic_context: str | None
+
+
 class StreamChunk(BaseModel):
-    """A chunk from streaming response."""
+    """
+    A chunk from streaming response.
+
+    Built with model_construct inside this module: one is created per
+    provider delta, and every field is produced here already typed.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     content: str
     is_final: bool = False
     token_usage: TokenUsage | None = None
 
 
+@dataclass(slots=True)
+class _UsageCounter:
+    """Running per-expert token totals (plain ints, no validation on update)."""
+
+    input: int = 0
+    output: int = 0
+    cache_read: int = 0
+    cache_creation: int = 0
+
+
+# Retry/circuit-breaker tuning: 3 failures within 10s opens a provider's
+# circuit for at least 10s (longer if the server asked via Retry-After)
+_MAX_BACKOFF = 60.0
+_CIRCUIT_THRESHOLD = 3
+_CIRCUIT_WINDOW = 10.0
+_CIRCUIT_OPEN_SECONDS = 10.0
+
+
+@dataclass(slots=True)
+class _CircuitState:
+    """Consecutive-failure tracking for one provider."""
+
+    failures: int = 0
+    window_start: float = 0.0
+    open_until: float = 0.0
+
+
+# SDK exception -> Consilium exception, checked in insertion order
+_ERROR_MAP: dict[type[Exception], type[LLMError]] = {
+    anthropic.RateLimitError: LLMRateLimitError,
+    openai.RateLimitError: LLMRateLimitError,
+    anthropic.AuthenticationError: LLMAuthenticationError,
+    openai.AuthenticationError: LLMAuthenticationError,
+}
+
+# Raw HTTP status -> Consilium exception (OpenRouter goes through httpx directly)
+_HTTP_STATUS_ERRORS: dict[int, type[LLMError]] = {
+    429: LLMRateLimitError,
+    401: LLMAuthenticationError,
+}
+
+
+# Message fallback for errors without a usable type or status: one scan
+# instead of a chain of substring checks
+_ERROR_PATTERN = re.compile(
+    r"(?P<rate>rate.limit|\b429\b)"
+    r"|(?P<context>prompt is too long|context.length|too many tokens)"
+    r"|(?P<auth>authentication|\b401\b)",
+    re.IGNORECASE,
+)
+_ERROR_GROUPS: dict[str, type[LLMError]] = {
+    "rate": LLMRateLimitError,
+    "context": LLMContextLengthError,
+    "auth": LLMAuthenticationError,
+}
+
+
+def _classify_message(message: str) -> type[LLMError] | None:
+    """Map an error message to an LLMError class by its first known token."""
+    match = _ERROR_PATTERN.search(message)
+    if match is None or match.lastgroup is None:
+        return None
+    # .get: an alternative without a named group must not raise in here
+    return _ERROR_GROUPS.get(match.lastgroup)
+
+
+def _is_context_overflow(e: Exception) -> bool:
+    """Check whether a 400 from a provider SDK is a context-window overflow."""
+    if getattr(e, "code", None) == "context_length_exceeded":
+        return True
+    return _classify_message(getattr(e, "message", "")) is LLMContextLengthError
+
+
+def _retry_after(source: Any) -> float | None:
+    """Read a Retry-After hint (in seconds) from an exception or response."""
+    response = getattr(source, "response", source)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after", "")))
+    except ValueError:
+        # Missing, or an HTTP-date we don't bother parsing
+        return None
+
+
+def _raise_for_openrouter_status(status: int, response: Any) -> None:
+    """Raise the matching LLMError for an error status from either transport."""
+    if status < 400:
+        return
+    target = _HTTP_STATUS_ERRORS.get(status, LLMConnectionError)
+    if target is LLMRateLimitError:
+        raise LLMRateLimitError(
+            "OpenRouter rate limit exceeded", retry_after=_retry_after(response)
+        )
+    if target is LLMAuthenticationError:
+        raise LLMAuthenticationError("OpenRouter authentication failed")
+    raise target(f"OpenRouter HTTP error: {status}")
+
+
+def _reraise(e: Exception, provider: str = "") -> NoReturn:
+    """Re-raise a provider/transport exception as the matching LLMError."""
+    if isinstance(e, LLMError):
+        raise e
+    for cls, target in _ERROR_MAP.items():
+        if isinstance(e, cls):
+            if target is LLMRateLimitError:
+                raise LLMRateLimitError(str(e), retry_after=_retry_after(e)) from e
+            raise target(str(e)) from e
+    if isinstance(e, (anthropic.BadRequestError, openai.BadRequestError)):
+        if _is_context_overflow(e):
+            raise LLMContextLengthError(str(e)) from e
+    prefix = f"{provider} " if provider else ""
+    if isinstance(e, httpx.HTTPStatusError):
+        target = _HTTP_STATUS_ERRORS.get(e.response.status_code, LLMConnectionError)
+        if target is LLMRateLimitError:
+            raise LLMRateLimitError(
+                f"{prefix}HTTP error: {e}", retry_after=_retry_after(e)
+            ) from e
+        raise target(f"{prefix}HTTP error: {e}") from e
+    if isinstance(e, httpx.RequestError):
+        raise LLMConnectionError(f"{prefix}connection error: {e}") from e
+    status = getattr(e, "status_code", None)
+    fallback = _HTTP_STATUS_ERRORS.get(status) if isinstance(status, int) else None
+    if fallback is None:
+        fallback = _classify_message(str(e)) or LLMConnectionError
+    if fallback is LLMRateLimitError:
+        raise LLMRateLimitError(str(e), retry_after=_retry_after(e)) from e
+    raise fallback(str(e)) from e
+
+
+def _extract_json_span(content: str) -> str | None:
+    """
+    Locate the first complete JSON object in an LLM response.
+
+    Starts inside a ```json fence when there is one. A single pass over the
+    structural characters tracks brace depth and string state, so braces in
+    string values or trailing prose don't end the object early or late.
+    """
+    fence = content.find("```json")
+    start = content.find("{", fence + 7 if fence >= 0 else 0)
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped_pos = -1
+    for match in _JSON_STRUCTURAL.finditer(content, start):
+        pos = match.start()
+        if pos == escaped_pos:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_pos = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return content[start : pos + 1]
+    return None
+
+
+def _is_well_formed_contribution(fields: dict[str, Any]) -> bool:
+    """Check parsed contribution fields already match ExpertContribution's types."""
+    for key in ("domain_claims", "assumptions", "questions_remaining"):
+        value = fields[key]
+        if not isinstance(value, str) and not (
+            isinstance(value, list) and all(isinstance(v, str) for v in value)
+        ):
+            return False
+    deltas = fields["delta_requests"]
+    return (
+        isinstance(deltas, list)
+        and all(isinstance(d, dict) for d in deltas)
+        and isinstance(fields["narrative_fragment"], str)
+    )
+
+
+async def _coalesce_chunks(
+    chunks: AsyncIterator[StreamChunk],
+    max_chunks: int = 32,
+    max_delay: float = 0.02,
+    max_chars: int = 64,
+) -> AsyncGenerator[StreamChunk, None]:
+    """
+    Merge consecutive content deltas into fewer StreamChunks.
+
+    The first chunk is yielded immediately to keep time-to-first-token low.
+    After that, deltas are buffered until max_chunks deltas or max_chars
+    characters accumulate, or max_delay seconds pass since the first buffered
+    delta. Final chunks are never
+    merged so their token usage is preserved.
+
+    The pending read is kept in a task rather than cancelled on timeout,
+    since cancelling __anext__ would tear down the provider stream. When this
+    generator is closed, the pending read is cancelled and chunks is
+    aclose()d.
+    """
+    iterator = aiter(chunks)
+    pending: asyncio.Future[StreamChunk] | None = None
+    try:
+        try:
+            first = await anext(iterator)
+        except StopAsyncIteration:
+            return
+        yield first
+
+        if max_chunks <= 1:
+            async for chunk in iterator:
+                yield chunk
+            return
+
+        loop = asyncio.get_running_loop()
+        parts: list[str] = []
+        size = 0
+        deadline: float | None = None
+
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                # Time budget spent - flush what we have, keep waiting on the read
+                yield StreamChunk.model_construct(content="".join(parts))
+                parts, size, deadline = [], 0, None
+                continue
+
+            try:
+                chunk = pending.result()
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+
+            if chunk.is_final:
+                if parts:
+                    yield StreamChunk.model_construct(content="".join(parts))
+                    parts, size, deadline = [], 0, None
+                yield chunk
+                continue
+
+            parts.append(chunk.content)
+            size += len(chunk.content)
+            if deadline is None:
+                deadline = loop.time() + max_delay
+            if len(parts) >= max_chunks or size >= max_chars:
+                yield StreamChunk.model_construct(content="".join(parts))
+                parts, size, deadline = [], 0, None
+
+        if parts:
+            yield StreamChunk.model_construct(content="".join(parts))
+    finally:
+        # Closed early (consumer stopped, error, cancellation): stop the
+        # in-flight read first - aclose() fails while the source is running
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
 # =============================================================================
 # LLM Client
 # =============================================================================
@@ -69,14 +689,74 @@ class LLMClient:
     Tracks token usage per expert for cost monitoring.
     """
 
-    def __init__(self, settings: Settings | None = None):
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        enable_response_cache: bool | None = None,
+        cache_ttl: float | None = None,
+    ):
         self.settings = settings or get_settings()
         self._anthropic_client: AsyncAnthropic | None = None
         self._openai_client: AsyncOpenAI | None = None
         self._http_client: httpx.AsyncClient | None = None
 
+        # Deterministic (temperature 0) completions are replayed from disk
+        if enable_response_cache is None:
+            enable_response_cache = self.settings.response_cache_enabled
+        self._response_cache: ResponseCache | None = (
+            ResponseCache(
+                self.settings.response_cache_path,
+                ttl=cache_ttl if cache_ttl is not None else self.settings.response_cache_ttl,
+            )
+            if enable_response_cache
+            else None
+        )
+
+        # OpenRouter headers are fixed for the client's lifetime
+        self._openrouter_headers = {
+            "Authorization": f"Bearer {self.settings.openrouter_api_key}",
+            "HTTP-Referer": "https://consilium.local",
+            "X-Title": "Consilium",
+            "Content-Type": "application/json",
+        }
+
         # Token tracking per expert
-        self._token_usage: dict[str, TokenUsage] = {}
+        self._token_usage: dict[str, _UsageCounter] = {}
+
+        # Model string -> provider; known models up front, others filled lazily
+        self._provider_cache: dict[str, ModelProvider] = {
+            m.value: self.settings.get_model_provider(m.value) for m in ModelType
+        }
+
+        # Single dispatch point per provider for complete() and stream()
+        self._complete_by_provider = {
+            ModelProvider.ANTHROPIC: self._complete_anthropic,
+            ModelProvider.OPENAI: self._complete_openai,
+            ModelProvider.OPENROUTER: self._complete_openrouter,
+        }
+        self._stream_by_provider = {
+            ModelProvider.ANTHROPIC: self._stream_anthropic,
+            ModelProvider.OPENAI: self._stream_openai,
+            ModelProvider.OPENROUTER: self._stream_openrouter,
+        }
+
+        # Caps in-flight calls per provider so parallel experts queue locally
+        # instead of tripping the provider's rate limit
+        self._semaphores: dict[ModelProvider, asyncio.Semaphore] = {
+            provider: asyncio.Semaphore(
+                self.settings.max_concurrent_per_provider.get(provider.value, 8)
+            )
+            for provider in ModelProvider
+        }
+
+        # Monotonic time each provider is cooling down until after a 429,
+        # shared by all concurrent callers on this client
+        self._cooldown_until: dict[ModelProvider, float] = {}
+
+        # Per-provider circuit breakers; an open circuit fails calls fast
+        self._circuits: dict[ModelProvider, _CircuitState] = {
+            provider: _CircuitState() for provider in ModelProvider
+        }
 
     async def __aenter__(self) -> "LLMClient":
         """Async context manager entry."""
@@ -88,48 +768,211 @@ class LLMClient:
         await self.close()
 
     async def _ensure_clients(self) -> None:
-        """Initialize clients if needed."""
+        """
+        Initialize clients if needed.
+
+        The SDK clients are built on the shared pooled HTTP client, so all
+        three providers reuse one set of keep-alive connections.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = await get_shared_http_client()
+            # SDK clients bound to a previous pool must be rebuilt
+            self._anthropic_client = None
+            self._openai_client = None
+
         if self._anthropic_client is None and self.settings.has_anthropic_key:
-            self._anthropic_client = AsyncAnthropic(
-                api_key=self.settings.anthropic_api_key,
+            self._anthropic_client = _build_sdk_client(
+                AsyncAnthropic, self.settings.anthropic_api_key, self._http_client
             )
 
         if self._openai_client is None and self.settings.has_openai_key:
-            self._openai_client = AsyncOpenAI(
-                api_key=self.settings.openai_api_key,
+            self._openai_client = _build_sdk_client(
+                AsyncOpenAI, self.settings.openai_api_key, self._http_client
             )
 
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(120.0, connect=10.0),
+    async def close(self) -> None:
+        """
+        Release clients held by this instance.
+
+        The pooled HTTP client is shared process-wide and stays open; it is
+        closed by close_llm_client() at application shutdown. The SDK clients
+        run on that pool, so they are dropped rather than closed.
+        """
+        self._anthropic_client = None
+        self._openai_client = None
+        self._http_client = None
+        if self._response_cache is not None:
+            self._response_cache.close()
+
+    def _timeout(self, timeout_cls: type, stream: bool = False) -> Any:
+        """
+        Per-request timeout for a provider call.
+
+        timeout_cls is the provider library's Timeout type (httpx, anthropic
+        or openai); they share httpx's signature.
+        """
+        read = (
+            self.settings.llm_read_timeout_stream
+            if stream
+            else self.settings.llm_read_timeout_chat
+        )
+        return timeout_cls(
+            connect=self.settings.llm_connect_timeout, read=read, write=30.0, pool=10.0
+        )
+
+    @staticmethod
+    def _backoff_delay(
+        retry_delay: float, attempt: int, retry_after: float | None = None
+    ) -> float:
+        """Decorrelated-jitter exponential backoff, never shorter than the server's hint."""
+        ceiling = min(_MAX_BACKOFF, retry_delay * 3 * (2**attempt))
+        delay = random.uniform(retry_delay, max(retry_delay, ceiling))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _check_circuit(self, provider: ModelProvider) -> None:
+        """Fail fast while a provider's circuit is open."""
+        remaining = self._circuits[provider].open_until - time.monotonic()
+        if remaining > 0:
+            raise LLMRateLimitError(
+                f"{provider.value} circuit open after repeated failures",
+                retry_after=remaining,
             )
 
-    async def close(self) -> None:
-        """Close all clients."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+    def _record_failure(
+        self, provider: ModelProvider, retry_after: float | None = None
+    ) -> None:
+        """Count a 429/5xx/timeout and open the circuit if they cluster."""
+        circuit = self._circuits[provider]
+        now = time.monotonic()
+        if now - circuit.window_start > _CIRCUIT_WINDOW:
+            circuit.failures = 0
+            circuit.window_start = now
+        circuit.failures += 1
+        if circuit.failures >= _CIRCUIT_THRESHOLD:
+            circuit.open_until = now + max(retry_after or 0.0, _CIRCUIT_OPEN_SECONDS)
+            circuit.failures = 0
+            logger.warning(
+                f"{provider.value} circuit opened for "
+                f"{circuit.open_until - now:.1f}s after repeated failures"
+            )
+
+    def _start_cooldown(self, provider: ModelProvider, delay: float) -> None:
+        """Hold all calls to a provider for at least delay seconds."""
+        until = time.monotonic() + delay
+        if until > self._cooldown_until.get(provider, 0.0):
+            self._cooldown_until[provider] = until
+
+    async def _wait_for_cooldown(self, provider: ModelProvider) -> None:
+        """Sleep out any active rate-limit cooldown for a provider."""
+        remaining = self._cooldown_until.get(provider, 0.0) - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
 
     def _get_provider(self, model: str) -> ModelProvider:
         """Determine provider for a model."""
-        return self.settings.get_model_provider(model)
+        provider = self._provider_cache.get(model)
+        if provider is None:
+            provider = self.settings.get_model_provider(model)
+            self._provider_cache[model] = provider
+        return provider
 
     def _track_usage(
-        self, expert: str, input_tokens: int, output_tokens: int
+        self,
+        expert: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
     ) -> None:
         """Track cumulative token usage per expert."""
-        if expert not in self._token_usage:
-            self._token_usage[expert] = TokenUsage()
-        self._token_usage[expert].input_tokens += input_tokens
-        self._token_usage[expert].output_tokens += output_tokens
+        usage = self._token_usage.get(expert)
+        if usage is None:
+            usage = self._token_usage[expert] = _UsageCounter()
+        usage.input += input_tokens
+        usage.output += output_tokens
+        usage.cache_read += cache_read_tokens
+        usage.cache_creation += cache_creation_tokens
 
     def get_usage_summary(self) -> dict[str, dict[str, int]]:
         """Return token usage by expert for cost tracking."""
         return {
-            expert: {"input": usage.input_tokens, "output": usage.output_tokens}
+            expert: {
+                "input": usage.input,
+                "output": usage.output,
+                "cache_read": usage.cache_read,
+                "cache_creation": usage.cache_creation,
+            }
             for expert, usage in self._token_usage.items()
         }
 
+    @staticmethod
+    def _anthropic_system(system: str | list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Wrap a system prompt as cacheable Anthropic content blocks.
+
+        Pre-built block lists (e.g. from cache_breakpoints) pass through.
+        """
+        if isinstance(system, list):
+            return system
+        return list(_anthropic_system_blocks(system))
+
+    @staticmethod
+    def _breakpoint_blocks(
+        provider: ModelProvider,
+        system: str | None,
+        cache_breakpoints: list[int] | None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Pre-split an Anthropic system prompt at the requested cache breakpoints.
+
+        Returns None when there is nothing to split or the provider is not
+        Anthropic; the other providers always take the plain string.
+        """
+        if not (system and cache_breakpoints) or provider != ModelProvider.ANTHROPIC:
+            return None
+        return list(_anthropic_system_blocks(system, tuple(cache_breakpoints)))
+
+    @staticmethod
+    def _pin_static_context(
+        provider: ModelProvider,
+        model: str,
+        static_context: str | None,
+        messages: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Prepend static context, marking it cacheable where the provider needs it.
+
+        Anthropic needs no marker here: _anthropic_messages puts a breakpoint on
+        the turn before the last, which covers the static context.
+        """
+        explicit = provider == ModelProvider.OPENROUTER and _wants_explicit_cache(
+            model, static_context
+        )
+        return _with_static_context(static_context, messages, explicit_cache=explicit)
+
+    @staticmethod
+    def _anthropic_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Mark the last stable turn of a multi-turn conversation as cacheable.
+
+        The final message changes every call, so the breakpoint goes on the
+        one before it; single-turn requests are returned unchanged.
+        """
+        if len(messages) < 2:
+            return messages
+
+        stable = messages[-2]
+        content = stable.get("content")
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            content = [*content[:-1], dict(content[-1])]
+        else:
+            return messages
+
+        content[-1]["cache_control"] = {"type": "ephemeral"}
+        return [*messages[:-2], {**stable, "content": content}, messages[-1]]
+
     # =========================================================================
     # Anthropic API
     # =========================================================================
@@ -138,7 +981,7 @@ class LLMClient:
         self,
         model: str,
         messages: list[dict[str, Any]],
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
         expert: str | None = None,
@@ -152,41 +995,46 @@ class LLMClient:
         try:
             kwargs: dict[str, Any] = {
                 "model": model,
-                "messages": messages,
+                "messages": self._anthropic_messages(messages),
                 "max_tokens": max_tokens,
                 "temperature": temperature,
+                "extra_headers": ANTHROPIC_CACHE_HEADERS,
+                "timeout": self._timeout(anthropic.Timeout),
             }
             if system:
-                kwargs["system"] = system
+                kwargs["system"] = self._anthropic_system(system)
 
             response = await self._anthropic_client.messages.create(**kwargs)
 
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content += block.text
+            content = "".join(
+                block.text for block in response.content if getattr(block, "text", None)
+            )
 
             input_tokens = response.usage.input_tokens
             output_tokens = response.usage.output_tokens
+            cache_read_tokens = getattr(response.usage, "cache_read_input_tokens", 0) or 0
+            cache_creation_tokens = (
+                getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+            )
 
             token_usage = TokenUsage(
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                cache_read_tokens=getattr(
-                    response.usage, "cache_read_input_tokens", 0
-                )
-                or 0,
-                cache_creation_tokens=getattr(
-                    response.usage, "cache_creation_input_tokens", 0
-                )
-                or 0,
+                cache_read_tokens=cache_read_tokens,
+                cache_creation_tokens=cache_creation_tokens,
                 model=model,
             )
 
             if expert:
-                self._track_usage(expert, input_tokens, output_tokens)
+                self._track_usage(
+                    expert,
+                    input_tokens,
+                    output_tokens,
+                    cache_read_tokens,
+                    cache_creation_tokens,
+                )
 
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 content=content,
                 token_usage=token_usage,
                 model=model,
@@ -194,20 +1042,13 @@ class LLMClient:
             )
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "rate limit" in error_msg or "429" in error_msg:
-                raise LLMRateLimitError(str(e))
-            if "context length" in error_msg or "too many tokens" in error_msg:
-                raise LLMContextLengthError(str(e))
-            if "authentication" in error_msg or "401" in error_msg:
-                raise LLMAuthenticationError(str(e))
-            raise LLMConnectionError(str(e))
+            _reraise(e)
 
     async def _stream_anthropic(
         self,
         model: str,
         messages: list[dict[str, Any]],
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
     ) -> AsyncIterator[StreamChunk]:
@@ -220,31 +1061,36 @@ class LLMClient:
         try:
             kwargs: dict[str, Any] = {
                 "model": model,
-                "messages": messages,
+                "messages": self._anthropic_messages(messages),
                 "max_tokens": max_tokens,
                 "temperature": temperature,
+                "extra_headers": ANTHROPIC_CACHE_HEADERS,
+                "timeout": self._timeout(anthropic.Timeout, stream=True),
             }
             if system:
-                kwargs["system"] = system
+                kwargs["system"] = self._anthropic_system(system)
 
             async with self._anthropic_client.messages.stream(**kwargs) as stream:
                 async for text in stream.text_stream:
-                    yield StreamChunk(content=text)
+                    yield StreamChunk.model_construct(content=text)
 
                 # Final message with usage
                 final = await stream.get_final_message()
                 token_usage = TokenUsage(
                     input_tokens=final.usage.input_tokens,
                     output_tokens=final.usage.output_tokens,
+                    cache_read_tokens=getattr(final.usage, "cache_read_input_tokens", 0) or 0,
+                    cache_creation_tokens=(
+                        getattr(final.usage, "cache_creation_input_tokens", 0) or 0
+                    ),
                     model=model,
                 )
-                yield StreamChunk(content="", is_final=True, token_usage=token_usage)
+                yield StreamChunk.model_construct(
+                    content="", is_final=True, token_usage=token_usage
+                )
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "rate limit" in error_msg:
-                raise LLMRateLimitError(str(e))
-            raise LLMConnectionError(str(e))
+            _reraise(e)
 
     # =========================================================================
     # OpenAI API
@@ -265,11 +1111,7 @@ class LLMClient:
         if not self._openai_client:
             raise LLMAuthenticationError("OpenAI API key not configured")
 
-        # Build messages list with system message
-        all_messages = []
-        if system:
-            all_messages.append({"role": "system", "content": system})
-        all_messages.extend(messages)
+        all_messages = _build_cacheable_messages(system, messages)
 
         try:
             response = await self._openai_client.chat.completions.create(
@@ -277,22 +1119,28 @@ class LLMClient:
                 messages=all_messages,
                 max_tokens=max_tokens,
                 temperature=temperature,
+                timeout=self._timeout(openai.Timeout),
             )
 
             content = response.choices[0].message.content or ""
-            input_tokens = response.usage.prompt_tokens if response.usage else 0
-            output_tokens = response.usage.completion_tokens if response.usage else 0
+            usage = response.usage
+            input_tokens = usage.prompt_tokens if usage else 0
+            output_tokens = usage.completion_tokens if usage else 0
+            details = getattr(usage, "prompt_tokens_details", None)
+            cache_read_tokens = getattr(details, "cached_tokens", 0) or 0
 
             token_usage = TokenUsage(
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_creation_tokens=0,
                 model=model,
             )
 
             if expert:
-                self._track_usage(expert, input_tokens, output_tokens)
+                self._track_usage(expert, input_tokens, output_tokens, cache_read_tokens)
 
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 content=content,
                 token_usage=token_usage,
                 model=model,
@@ -300,14 +1148,7 @@ class LLMClient:
             )
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "rate limit" in error_msg or "429" in error_msg:
-                raise LLMRateLimitError(str(e))
-            if "context length" in error_msg or "too many tokens" in error_msg:
-                raise LLMContextLengthError(str(e))
-            if "authentication" in error_msg or "401" in error_msg:
-                raise LLMAuthenticationError(str(e))
-            raise LLMConnectionError(str(e))
+            _reraise(e)
 
     async def _stream_openai(
         self,
@@ -323,10 +1164,7 @@ class LLMClient:
         if not self._openai_client:
             raise LLMAuthenticationError("OpenAI API key not configured")
 
-        all_messages = []
-        if system:
-            all_messages.append({"role": "system", "content": system})
-        all_messages.extend(messages)
+        all_messages = _build_cacheable_messages(system, messages)
 
         try:
             stream = await self._openai_client.chat.completions.create(
@@ -335,19 +1173,17 @@ class LLMClient:
                 max_tokens=max_tokens,
                 temperature=temperature,
                 stream=True,
+                timeout=self._timeout(openai.Timeout, stream=True),
             )
 
             async for chunk in stream:
                 if chunk.choices and chunk.choices[0].delta.content:
-                    yield StreamChunk(content=chunk.choices[0].delta.content)
+                    yield StreamChunk.model_construct(content=chunk.choices[0].delta.content)
                 if chunk.choices and chunk.choices[0].finish_reason:
-                    yield StreamChunk(content="", is_final=True)
+                    yield StreamChunk.model_construct(content="", is_final=True)
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "rate limit" in error_msg:
-                raise LLMRateLimitError(str(e))
-            raise LLMConnectionError(str(e))
+            _reraise(e)
 
     # =========================================================================
     # OpenRouter API
@@ -368,10 +1204,7 @@ class LLMClient:
         if not self.settings.has_openrouter_key:
             raise LLMAuthenticationError("OpenRouter API key not configured")
 
-        # Prepend system message if provided
-        all_messages = messages.copy()
-        if system:
-            all_messages.insert(0, {"role": "system", "content": system})
+        all_messages = _build_cacheable_messages(system, messages)
 
         payload = {
             "model": model,
@@ -380,52 +1213,35 @@ class LLMClient:
             "temperature": temperature,
         }
 
-        try:
-            assert self._http_client is not None
-            response = await self._http_client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.settings.openrouter_api_key}",
-                    "HTTP-Referer": "https://consilium.local",
-                    "X-Title": "Consilium",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-
-            if response.status_code == 429:
-                raise LLMRateLimitError("OpenRouter rate limit exceeded")
-            if response.status_code == 401:
-                raise LLMAuthenticationError("OpenRouter authentication failed")
-
-            response.raise_for_status()
-            data = response.json()
-
-            content = data["choices"][0]["message"]["content"]
-            usage = data.get("usage", {})
-            input_tokens = usage.get("prompt_tokens", 0)
-            output_tokens = usage.get("completion_tokens", 0)
-
-            token_usage = TokenUsage(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                model=model,
-            )
-
-            if expert:
-                self._track_usage(expert, input_tokens, output_tokens)
+        data = await self._openrouter_post(orjson.dumps(payload))
+
+        # Raw JSON, unlike the SDK paths: content is null for refusals and
+        # tool-only replies
+        content = data["choices"][0]["message"].get("content") or ""
+        usage = data.get("usage") or {}
+        input_tokens = usage.get("prompt_tokens") or 0
+        output_tokens = usage.get("completion_tokens") or 0
+        details = usage.get("prompt_tokens_details") or {}
+        cache_read_tokens = details.get("cached_tokens") or 0
+
+        token_usage = TokenUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=0,
+            model=model,
+        )
 
-            return LLMResponse(
-                content=content,
-                token_usage=token_usage,
-                model=model,
-                finish_reason=data["choices"][0].get("finish_reason"),
-            )
+        if expert:
+            self._track_usage(expert, input_tokens, output_tokens, cache_read_tokens)
 
-        except httpx.HTTPStatusError as e:
-            raise LLMConnectionError(f"OpenRouter HTTP error: {e}")
-        except httpx.RequestError as e:
-            raise LLMConnectionError(f"OpenRouter connection error: {e}")
+        # Validated: the payload was never typed by an SDK
+        return LLMResponse(
+            content=content,
+            token_usage=token_usage,
+            model=model,
+            finish_reason=data["choices"][0].get("finish_reason"),
+        )
 
     async def _stream_openrouter(
         self,
@@ -441,9 +1257,7 @@ class LLMClient:
         if not self.settings.has_openrouter_key:
             raise LLMAuthenticationError("OpenRouter API key not configured")
 
-        all_messages = messages.copy()
-        if system:
-            all_messages.insert(0, {"role": "system", "content": system})
+        all_messages = _build_cacheable_messages(system, messages)
 
         payload = {
             "model": model,
@@ -453,39 +1267,101 @@ class LLMClient:
             "stream": True,
         }
 
+        # Bound once; this loop runs per token
+        loads = orjson.loads
+        async with self._openrouter_stream(orjson.dumps(payload)) as byte_chunks:
+            # Split raw bytes into lines ourselves - no per-line str decode
+            async for event in _aiter_sse_data(byte_chunks):
+                if event == _SSE_DONE:
+                    yield StreamChunk.model_construct(content="", is_final=True)
+                    return
+                try:
+                    data = loads(event)
+                except orjson.JSONDecodeError:
+                    continue
+                # Usage-only and error frames carry no choices
+                choices = data.get("choices")
+                if not choices:
+                    continue
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield StreamChunk.model_construct(content=content)
+
+    def _aiohttp_timeout(self, stream: bool = False) -> "aiohttp.ClientTimeout":
+        """aiohttp equivalent of _timeout()."""
+        import aiohttp
+
+        read = (
+            self.settings.llm_read_timeout_stream
+            if stream
+            else self.settings.llm_read_timeout_chat
+        )
+        return aiohttp.ClientTimeout(
+            total=None, connect=self.settings.llm_connect_timeout, sock_read=read
+        )
+
+    async def _openrouter_post(self, body: bytes) -> dict[str, Any]:
+        """POST a chat completion to OpenRouter and return the decoded JSON."""
+        if self.settings.openrouter_transport == "aiohttp":
+            session = await get_shared_aiohttp_session()
+            import aiohttp
+            try:
+                async with session.post(
+                    OPENROUTER_CHAT_URL,
+                    headers=self._openrouter_headers,
+                    data=body,
+                    timeout=self._aiohttp_timeout(),
+                ) as response:
+                    _raise_for_openrouter_status(response.status, response)
+                    return orjson.loads(await response.read())
+            except (aiohttp.ClientError, TimeoutError) as e:
+                raise LLMConnectionError(f"OpenRouter connection error: {e}") from e
+
+        try:
+            assert self._http_client is not None
+            response = await self._http_client.post(
+                OPENROUTER_CHAT_URL,
+                headers=self._openrouter_headers,
+                content=body,
+                timeout=self._timeout(httpx.Timeout),
+            )
+            _raise_for_openrouter_status(response.status_code, response)
+            return orjson.loads(response.content)
+        except httpx.RequestError as e:
+            _reraise(e, "OpenRouter")
+
+    @asynccontextmanager
+    async def _openrouter_stream(self, body: bytes) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Open a streaming OpenRouter request and expose the raw body chunks."""
+        if self.settings.openrouter_transport == "aiohttp":
+            session = await get_shared_aiohttp_session()
+            import aiohttp
+            try:
+                async with session.post(
+                    OPENROUTER_CHAT_URL,
+                    headers=self._openrouter_headers,
+                    data=body,
+                    timeout=self._aiohttp_timeout(stream=True),
+                ) as response:
+                    _raise_for_openrouter_status(response.status, response)
+                    yield response.content.iter_chunked(8192)
+            except (aiohttp.ClientError, TimeoutError) as e:
+                raise LLMConnectionError(f"OpenRouter connection error: {e}") from e
+            return
+
         try:
             assert self._http_client is not None
             async with self._http_client.stream(
                 "POST",
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.settings.openrouter_api_key}",
-                    "HTTP-Referer": "https://consilium.local",
-                    "X-Title": "Consilium",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
+                OPENROUTER_CHAT_URL,
+                headers=self._openrouter_headers,
+                content=body,
+                timeout=self._timeout(httpx.Timeout, stream=True),
             ) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data_str = line[6:]
-                        if data_str == "[DONE]":
-                            yield StreamChunk(content="", is_final=True)
-                            break
-                        try:
-                            data = json.loads(data_str)
-                            delta = data["choices"][0].get("delta", {})
-                            content = delta.get("content", "")
-                            if content:
-                                yield StreamChunk(content=content)
-                        except json.JSONDecodeError:
-                            continue
-
-        except httpx.HTTPStatusError as e:
-            raise LLMConnectionError(f"OpenRouter HTTP error: {e}")
+                _raise_for_openrouter_status(response.status_code, response)
+                yield response.aiter_bytes(chunk_size=8192)
         except httpx.RequestError as e:
-            raise LLMConnectionError(f"OpenRouter connection error: {e}")
+            _reraise(e, "OpenRouter")
 
     # =========================================================================
     # Public API
@@ -501,10 +1377,21 @@ class LLMClient:
         retries: int = 3,
         retry_delay: float = 1.0,
         expert: str | None = None,
+        timeout: float | None = None,
+        cache_breakpoints: list[int] | None = None,
+        static_context: str | None = None,
+        persistent_context: str | None = None,
+        dynamic_context: str | None = None,
     ) -> LLMResponse:
         """
         Complete a chat conversation.
 
+        Prompt caching only reuses an unchanged prefix. Keep system to the
+        static persona, put session-stable material in persistent_context or
+        static_context, and put anything that changes per round in
+        dynamic_context: mutating persistent_context between calls
+        invalidates the cache from that point on.
+
         Args:
             model: Model to use (ModelType enum or string)
             messages: List of message dicts with 'role' and 'content'
@@ -514,39 +1401,85 @@ class LLMClient:
             retries: Number of retries on transient errors
             retry_delay: Initial delay between retries (exponential backoff)
             expert: Expert codename for token tracking
+            timeout: Overall deadline per attempt in seconds; a timed-out
+                attempt is cancelled and retried like a connection error
+            cache_breakpoints: Character offsets splitting the system prompt
+                into separately cached blocks (Anthropic only; other
+                providers cache stable prefixes automatically)
+            static_context: Session-stable context (e.g. canonical ScenarioSheet
+                JSON) pinned ahead of messages so it falls inside the cached
+                prefix; must not change between rounds
+            persistent_context: Stable context appended to the system prompt
+                as a separately cached block
+            dynamic_context: Per-call context (memory, objection log, sheet
+                deltas) sent after the last message; never cached
 
         Returns:
-            LLMResponse with content and token usage
+            LLMResponse with content and token usage. Temperature-0 calls may
+            be served from the response cache without a provider request;
+            such hits are not added to get_usage_summary().
         """
-        model_str = model.value if isinstance(model, ModelType) else model
+        model_str = _model_id(model)
         provider = self._get_provider(model_str)
+        complete_fn = self._complete_by_provider[provider]
+        system, cache_breakpoints = _with_persistent_context(
+            system, persistent_context, cache_breakpoints
+        )
+        blocks = self._breakpoint_blocks(provider, system, cache_breakpoints)
+        messages = self._pin_static_context(provider, model_str, static_context, messages)
+        messages = _with_dynamic_context(messages, dynamic_context)
+
+        # Only deterministic completions are replayed
+        cache = self._response_cache if temperature == 0.0 else None
+        cache_key = ""
+        if cache is not None:
+            cache_key = ResponseCache.make_key(
+                model_str, messages, blocks or system, max_tokens, temperature
+            )
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                # No provider tokens are spent, so nothing goes to _track_usage;
+                # token_usage still reports what the original call cost
+                logger.debug(f"Response cache hit for {model_str}")
+                return LLMResponse.model_validate(cached)
 
         for attempt in range(retries):
+            self._check_circuit(provider)
+            await self._wait_for_cooldown(provider)
             try:
-                if provider == ModelProvider.ANTHROPIC:
-                    return await self._complete_anthropic(
-                        model_str, messages, system, max_tokens, temperature, expert
-                    )
-                elif provider == ModelProvider.OPENAI:
-                    return await self._complete_openai(
-                        model_str, messages, system, max_tokens, temperature, expert
-                    )
-                else:
-                    return await self._complete_openrouter(
-                        model_str, messages, system, max_tokens, temperature, expert
-                    )
-            except LLMRateLimitError:
+                async with self._semaphores[provider]:
+                    if blocks is not None:
+                        call = self._complete_anthropic(
+                            model_str, messages, blocks, max_tokens, temperature, expert
+                        )
+                    else:
+                        call = complete_fn(
+                            model_str, messages, system, max_tokens, temperature, expert
+                        )
+                    response = await asyncio.wait_for(call, timeout=timeout)
+                self._circuits[provider].failures = 0
+                if cache is not None:
+                    await cache.set(cache_key, response.model_dump(mode="json"))
+                return response
+            except LLMRateLimitError as e:
+                self._record_failure(provider, e.retry_after)
                 if attempt < retries - 1:
-                    delay = retry_delay * (2**attempt)
-                    logger.warning(f"Rate limited, retrying in {delay}s...")
-                    await asyncio.sleep(delay)
+                    delay = self._backoff_delay(retry_delay, attempt, e.retry_after)
+                    self._start_cooldown(provider, delay)
+                    logger.warning(f"Rate limited, retrying in {delay:.2f}s...")
                 else:
                     raise
-            except LLMConnectionError:
+            except (LLMConnectionError, TimeoutError) as e:
+                self._record_failure(provider)
                 if attempt < retries - 1:
-                    delay = retry_delay * (2**attempt)
-                    logger.warning(f"Connection error, retrying in {delay}s...")
+                    delay = self._backoff_delay(retry_delay, attempt)
+                    reason = "Timed out" if isinstance(e, TimeoutError) else "Connection error"
+                    logger.warning(f"{reason}, retrying in {delay:.2f}s...")
                     await asyncio.sleep(delay)
+                elif isinstance(e, TimeoutError):
+                    raise LLMConnectionError(
+                        f"{provider.value} call timed out after {timeout}s"
+                    ) from e
                 else:
                     raise
 
@@ -584,8 +1517,71 @@ class LLMClient:
             system=system,
             max_tokens=max_tokens,
             expert=expert_codename,
+            timeout=config.timeout_s,
         )
 
+    async def complete_for_experts(
+        self,
+        items: list[tuple[str, str, str]],
+        max_tokens: int = 4096,
+    ) -> list[LLMResponse]:
+        """
+        Run complete_for_expert for several experts concurrently.
+
+        Calls overlap across providers; the per-provider semaphores still cap
+        how many reach each API at once. Usage tracking needs no lock since
+        each update runs without yielding to the event loop.
+
+        Args:
+            items: (expert_codename, system, prompt) per expert
+            max_tokens: Maximum tokens to generate per expert
+
+        Returns:
+            LLMResponses in the same order as items
+
+        Raises:
+            ExceptionGroup: If any call fails; the remaining calls are cancelled
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self.complete_for_expert(codename, system, prompt, max_tokens)
+                )
+                for codename, system, prompt in items
+            ]
+        return [task.result() for task in tasks]
+
+    async def complete_batch(
+        self,
+        calls: list[CompleteCall],
+        max_concurrency: int = 8,
+    ) -> list[LLMResponse]:
+        """
+        Run several complete() calls concurrently.
+
+        At most max_concurrency calls are in flight from this batch; the
+        per-provider semaphores still apply across all callers on top of it.
+
+        Args:
+            calls: Keyword arguments for complete(), one dict per call
+            max_concurrency: Cap on this batch's simultaneous calls
+
+        Returns:
+            LLMResponses in the same order as calls
+
+        Raises:
+            ExceptionGroup: If any call fails; the remaining calls are cancelled
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def guarded(call: CompleteCall) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(**call)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(guarded(call)) for call in calls]
+        return [task.result() for task in tasks]
+
     async def stream(
         self,
         model: str | ModelType,
@@ -593,6 +1589,10 @@ class LLMClient:
         system: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        cache_breakpoints: list[int] | None = None,
+        static_context: str | None = None,
+        persistent_context: str | None = None,
+        dynamic_context: str | None = None,
     ) -> AsyncIterator[StreamChunk]:
         """
         Stream a chat conversation.
@@ -603,27 +1603,42 @@ class LLMClient:
             system: Optional system prompt
             max_tokens: Maximum tokens
             temperature: Sampling temperature
+            cache_breakpoints: Character offsets splitting the system prompt
+                into separately cached blocks (Anthropic only)
+            static_context: Session-stable context pinned ahead of messages
+            persistent_context: Stable context cached after the system prompt
+            dynamic_context: Per-call context sent after the last message
 
         Yields:
-            StreamChunk objects with content
+            StreamChunk objects with content. The first delta is passed through
+            immediately; later deltas are coalesced per the stream_coalesce_*
+            settings.
         """
-        model_str = model.value if isinstance(model, ModelType) else model
+        model_str = _model_id(model)
         provider = self._get_provider(model_str)
+        system, cache_breakpoints = _with_persistent_context(
+            system, persistent_context, cache_breakpoints
+        )
+        blocks = self._breakpoint_blocks(provider, system, cache_breakpoints)
+        messages = self._pin_static_context(provider, model_str, static_context, messages)
+        messages = _with_dynamic_context(messages, dynamic_context)
 
-        if provider == ModelProvider.ANTHROPIC:
-            async for chunk in self._stream_anthropic(
-                model_str, messages, system, max_tokens, temperature
-            ):
-                yield chunk
-        elif provider == ModelProvider.OPENAI:
-            async for chunk in self._stream_openai(
-                model_str, messages, system, max_tokens, temperature
-            ):
-                yield chunk
+        if blocks is not None:
+            chunks = self._stream_anthropic(model_str, messages, blocks, max_tokens, temperature)
         else:
-            async for chunk in self._stream_openrouter(
+            chunks = self._stream_by_provider[provider](
                 model_str, messages, system, max_tokens, temperature
-            ):
+            )
+
+        coalesced = _coalesce_chunks(
+            chunks,
+            max_chunks=self.settings.stream_coalesce_max_chunks,
+            max_delay=self.settings.stream_coalesce_max_delay,
+            max_chars=self.settings.stream_coalesce_max_chars,
+        )
+        # aclosing: the provider stream is released as soon as this one is
+        async with self._semaphores[provider], aclosing(coalesced):
+            async for chunk in coalesced:
                 yield chunk
 
     # =========================================================================
@@ -642,40 +1657,35 @@ class LLMClient:
         """
         content = response.content.strip()
 
-        # Try to extract JSON from response
-        try:
-            # Look for JSON block
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                json_str = content[start:end].strip()
-            elif content.startswith("{"):
-                json_str = content
-            else:
-                # Try to find JSON object in content
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                if start >= 0 and end > start:
-                    json_str = content[start:end]
-                else:
-                    raise LLMResponseParseError(
-                        "No JSON found in response", raw_response=content
-                    )
-
-            data = json.loads(json_str)
-            return ExpertContribution(
-                expert=expert_codename,
-                domain_claims=data.get("domain_claims", []),
-                assumptions=data.get("assumptions", []),
-                questions_remaining=data.get("questions_remaining", []),
-                delta_requests=data.get("delta_requests", []),
-                narrative_fragment=data.get("narrative_fragment", ""),
+        span = _extract_json_span(content)
+        if span is None:
+            raise LLMResponseParseError(
+                "No JSON found in response", raw_response=content
             )
 
-        except json.JSONDecodeError as e:
+        try:
+            data = orjson.loads(span)
+        except orjson.JSONDecodeError as e:
             raise LLMResponseParseError(
                 f"Invalid JSON in response: {e}", raw_response=content
             )
+        if not isinstance(data, dict):
+            raise LLMResponseParseError(
+                "Response JSON is not an object", raw_response=content
+            )
+
+        fields = {
+            "expert": expert_codename,
+            "domain_claims": data.get("domain_claims", []),
+            "assumptions": data.get("assumptions", []),
+            "questions_remaining": data.get("questions_remaining", []),
+            "delta_requests": data.get("delta_requests", []),
+            "narrative_fragment": data.get("narrative_fragment", ""),
+        }
+        # Well-shaped payloads skip validation; anything odd goes through it
+        if _is_well_formed_contribution(fields):
+            return ExpertContribution.model_construct(**fields)
+        return ExpertContribution.model_validate(fields)
 
     async def complete_structured(
         self,
@@ -695,27 +1705,91 @@ class LLMClient:
         contribution = self.parse_expert_contribution(response, expert_codename)
         return contribution, response.token_usage
 
+    def open_conversation(
+        self,
+        model: str | ModelType,
+        system: str | None = None,
+        static_context: str | None = None,
+        expert: str | None = None,
+    ) -> "ConversationHandle":
+        """
+        Start a multi-turn conversation that pins system + static context.
+
+        The pinned prefix is sent identically on every turn, so after the
+        first send() providers serve it from their prompt cache and each turn
+        only pays full price for the new messages.
+        """
+        model_str = _model_id(model)
+        return ConversationHandle(
+            client=self,
+            model=model_str,
+            system=system,
+            static_context=static_context,
+            expert=expert,
+        )
+
+
+@dataclass(slots=True)
+class ConversationHandle:
+    """
+    A conversation whose system prompt and static context stay fixed.
+
+    send() appends only the new messages (and the reply) to the history;
+    usage accumulates across turns, including cache-read tokens so callers
+    can confirm the pinned prefix is being reused.
+    """
+
+    client: LLMClient
+    model: str
+    system: str | None = None
+    static_context: str | None = None
+    expert: str | None = None
+    messages: list[dict[str, Any]] = field(default_factory=list)
+    usage: TokenUsage = field(default_factory=TokenUsage)
+
+    async def send(self, delta_messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        """Send new messages on top of the existing history."""
+        history = [*self.messages, *delta_messages]
+        response = await self.client.complete(
+            self.model,
+            history,
+            system=self.system,
+            expert=self.expert,
+            static_context=self.static_context,
+            **kwargs,
+        )
+        history.append({"role": "assistant", "content": response.content})
+        self.messages = history
+
+        turn = response.token_usage
+        self.usage += turn
+        return response
+
 
 # =============================================================================
 # Module-level client factory
 # =============================================================================
 
 
-_default_client: LLMClient | None = None
+# One default client per event loop; its HTTP pool is loop-bound too
+_default_clients: dict[asyncio.AbstractEventLoop, LLMClient] = {}
 
 
 async def get_llm_client() -> LLMClient:
-    """Get the default LLM client instance."""
-    global _default_client
-    if _default_client is None:
-        _default_client = LLMClient()
-        await _default_client._ensure_clients()
-    return _default_client
+    """Get the default LLM client instance for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None:
+        # Stored before the first await, so concurrent callers share it
+        _prune_closed_loops(_default_clients)
+        client = _default_clients[loop] = LLMClient()
+        await client._ensure_clients()
+    return client
 
 
 async def close_llm_client() -> None:
-    """Close the default LLM client."""
-    global _default_client
-    if _default_client:
-        await _default_client.close()
-        _default_client = None
+    """Close the running loop's default LLM client and shared HTTP pool."""
+    client = _default_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+    await close_shared_http_client()
@@ -1,10 +1,14 @@
 """Pydantic models for Consilium."""
 
+import hashlib
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Literal, Union
 from uuid import UUID, uuid4
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -117,6 +121,10 @@ class SessionStatus(str, Enum):
 # ScenarioSheet Components
 # =============================================================================
 
+# Nested fields typed Union[dict, Model] use union_mode="left_to_right": the
+# first arm that fits wins. The default smart mode validates JSON input against
+# every arm, recursively, only to keep the dict anyway.
+
 
 class UnitComposition(BaseModel):
     """Composition of a military unit."""
@@ -159,11 +167,16 @@ class ForceDescription(BaseModel):
     side_name: str = Field(default="", description="Name/identifier for this side")
     total_strength: Union[int, str] = Field(default=0, description="Total troop count")
     composition: Union[list[dict], list[UnitComposition]] = Field(
-        default_factory=list, description="Unit breakdown"
+        default_factory=list, description="Unit breakdown",
+        union_mode="left_to_right",
+    )
+    commander: Union[dict, Commander, None] = Field(
+        default=None, description="Commanding officer",
+        union_mode="left_to_right",
     )
-    commander: Union[dict, Commander, None] = Field(default=None, description="Commanding officer")
     sub_commanders: Union[list[dict], list[Commander]] = Field(
-        default_factory=list, description="Subordinate commanders"
+        default_factory=list, description="Subordinate commanders",
+        union_mode="left_to_right",
     )
     morale: str = Field(default="steady", description="Overall morale state")
     morale_factors: Union[str, list[str]] = Field(
@@ -196,7 +209,8 @@ class TerrainWeather(BaseModel):
     terrain_type: Union[TerrainType, str] = Field(default=TerrainType.PLAINS, description="Primary terrain")
     defining_feature: str = Field(default="", description="The one defining terrain feature")
     features: Union[list[dict], list[TerrainFeature]] = Field(
-        default_factory=list, description="Notable features"
+        default_factory=list, description="Notable features",
+        union_mode="left_to_right",
     )
     weather: Union[WeatherCondition, str] = Field(default=WeatherCondition.CLEAR)
     visibility: str = Field(default="good", description="Visibility conditions")
@@ -307,10 +321,12 @@ class ScenarioSheet(BaseModel):
         default_factory=list, description="Political/logistical/terrain constraints"
     )
     forces: Union[dict[str, Any], dict[str, ForceDescription]] = Field(
-        default_factory=dict, description="Forces keyed by side identifier"
+        default_factory=dict, description="Forces keyed by side identifier",
+        union_mode="left_to_right",
     )
     terrain_weather: Union[dict, TerrainWeather, None] = Field(
-        default=None, description="Terrain and weather"
+        default=None, description="Terrain and weather",
+        union_mode="left_to_right",
     )
     timeline: Union[str, list, dict, Any] = Field(
         default_factory=list, description="Anchor events with timestamps"
@@ -319,14 +335,16 @@ class ScenarioSheet(BaseModel):
         default_factory=list, description="Where commanders choose under uncertainty"
     )
     casualty_profile: Union[dict, CasualtyProfile, None] = Field(
-        default=None, description="Plausible injury/attrition pattern"
+        default=None, description="Plausible injury/attrition pattern",
+        union_mode="left_to_right",
     )
     aftermath: str = Field(default="", description="Immediate campaign consequence")
     open_risks: Union[str, list[str]] = Field(
         default_factory=list, description="Known vulnerabilities accepted by commanders"
     )
     magic: Union[dict, MagicSystem] = Field(
-        default_factory=MagicSystem, description="Magic system if present"
+        default_factory=MagicSystem, description="Magic system if present",
+        union_mode="left_to_right",
     )
 
     # Metadata
@@ -339,12 +357,30 @@ class ScenarioSheet(BaseModel):
         self.last_modified_by = modified_by
         self.consistency_hash = self._compute_hash()
 
-    def _compute_hash(self) -> str:
-        """Compute a hash for state tracking."""
-        import hashlib
+    def serialized(self) -> bytes:
+        """
+        Sorted-key JSON of the sheet, excluding the hash.
+
+        Not cached: nested values can be edited in place without bumping the
+        version, so a per-version cache could return a stale dump.
+        """
+        return orjson.dumps(
+            self.model_dump(mode="json", exclude={"consistency_hash"}),
+            option=orjson.OPT_SORT_KEYS,
+        )
 
-        content = self.model_dump_json(exclude={"consistency_hash"})
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+    def canonical_json(self) -> str:
+        """
+        Serialize with sorted keys, excluding the hash.
+
+        Identical sheet state always yields identical text, so it can be
+        pinned in LLM prompts without breaking provider prefix caches.
+        """
+        return self.serialized().decode()
+
+    def _compute_hash(self) -> str:
+        """Compute a hash for state tracking (BLAKE2b over the canonical form)."""
+        return hashlib.blake2b(self.serialized(), digest_size=8).hexdigest()
 
 
 # =============================================================================
@@ -377,7 +413,8 @@ class ExpertContribution(BaseModel):
         default_factory=list, description="What they still need answered"
     )
     delta_requests: Union[list[dict], list[DeltaRequest]] = Field(
-        default_factory=list, description="Proposed edits to ScenarioSheet"
+        default_factory=list, description="Proposed edits to ScenarioSheet",
+        union_mode="left_to_right",
     )
     narrative_fragment: str = Field(
         default="", description="Optional prose for final output"
@@ -405,7 +442,10 @@ class FilteredObjection(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    original: Union[dict, RedTeamObjection] = Field(description="Original objection")
+    original: Union[dict, RedTeamObjection] = Field(
+        description="Original objection",
+        union_mode="left_to_right",
+    )
     objection_type: Union[ObjectionType, str] = Field(default=ObjectionType.REFINABLE, description="Classification")
     moderator_notes: str = Field(default="", description="Moderator's reasoning")
     action_required: str = Field(default="", description="What needs to happen")
@@ -460,31 +500,62 @@ class ExpertInterrogation(BaseModel):
 # =============================================================================
 
 
-class TokenUsage(BaseModel):
+# TokenUsage and SSEEvent are created per LLM call / per event from trusted
+# internal values, so they are plain slotted dataclasses rather than
+# validating models. Pydantic still validates them when nested in models.
+
+
+@dataclass(slots=True)
+class TokenUsage:
     """Token usage tracking."""
 
-    input_tokens: int = Field(default=0)
-    output_tokens: int = Field(default=0)
-    cache_read_tokens: int = Field(default=0)
-    cache_creation_tokens: int = Field(default=0)
-    model: str = Field(default="")
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    model: str = ""
+    # Stored rather than derived so reads and serialization are plain slot
+    # access; accumulate with += to keep it in step with the counters
+    total_tokens: int = field(default=0, init=False)
 
-    @property
-    def total_tokens(self) -> int:
-        return self.input_tokens + self.output_tokens
+    def __post_init__(self) -> None:
+        self.total_tokens = self.input_tokens + self.output_tokens
+
+    def __iadd__(self, other: "TokenUsage") -> "TokenUsage":
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.total_tokens = self.input_tokens + self.output_tokens
+        return self
 
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
 
-class SSEEvent(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class SSEEvent:
     """Server-sent event with sequencing."""
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
-    sequence: int = Field(description="Monotonic counter for recovery")
-    event_type: str = Field(description="Event type")
-    data: dict[str, Any] = Field(default_factory=dict)
-    sheet_version: int = Field(description="Current ScenarioSheet version")
-    sheet_hash: str = Field(description="For change detection")
-    token_usage: TokenUsage | None = Field(default=None)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    sequence: int  # Monotonic counter for recovery; also the SSE event id
+    event_type: str
+    data: dict[str, Any] = field(default_factory=dict)
+    sheet_version: int  # Current ScenarioSheet version
+    sheet_hash: str  # For change detection
+    token_usage: TokenUsage | None = None
+    # time.monotonic_ns() at creation: orders events within the process and
+    # is cheap to take; sequence is the cross-reconnect ordering key
+    timestamp: int = field(default_factory=time.monotonic_ns)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def sse_payload(self) -> bytes:
+        """Encode as a complete SSE frame (id + JSON data line) in bytes."""
+        # The id is the sequence, which the endpoint reads back from
+        # Last-Event-ID on reconnect. orjson serializes dataclasses and enums
+        # natively.
+        return b"id: %d\ndata: %b\n\n" % (self.sequence, orjson.dumps(self))
 
 
 # =============================================================================
@@ -530,8 +601,10 @@ class SessionState(BaseModel):
 
     def next_sse_sequence(self) -> int:
         """Get and increment SSE sequence."""
-        seq = self.sse_sequence
-        self.sse_sequence += 1
+        # Called once per event; a plain int field needs no setattr machinery
+        fields = self.__dict__
+        seq = fields["sse_sequence"]
+        fields["sse_sequence"] = seq + 1
         return seq
 
     def touch(self) -> None:
@@ -616,6 +689,8 @@ class ConfigResponse(BaseModel):
 class ConsistencyViolation(BaseModel):
     """A detected consistency violation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     field: str = Field(description="Field with violation")
     violation_type: str = Field(description="Type of violation")
     description: str = Field(description="Description of the issue")
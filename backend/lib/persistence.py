@@ -5,13 +5,16 @@ Stores session state as JSON on disk with in-memory caching.
 
 import asyncio
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-import aiofiles
-import aiofiles.os
+import pydantic_core
 
 from backend.config import Settings, get_settings
 from backend.lib.exceptions import (
@@ -24,19 +27,38 @@ from backend.lib.models import SessionState
 logger = logging.getLogger(__name__)
 
 
+def _write_atomic(path: Path, content: bytes, durable: bool) -> None:
+    """Write via a temp file and rename, so readers never see a partial file."""
+    # Unique per writer thread: a cancelled flush may still be mid-write
+    tmp = path.with_suffix(f".json.tmp.{os.getpid()}.{threading.get_ident()}")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(content)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 class CacheEntry:
     """An entry in the session cache."""
 
     def __init__(self, session: SessionState, ttl_hours: int = 1):
+        # time.monotonic() seconds: cheaper than datetime and immune to
+        # wall-clock jumps; nothing here is persisted
+        now = time.monotonic()
         self.session = session
-        self.expires_at = datetime.utcnow() + timedelta(hours=ttl_hours)
-        self.last_accessed = datetime.utcnow()
+        self.expires_at = now + ttl_hours * 3600
+        self.last_accessed = now
 
     def is_expired(self) -> bool:
-        return datetime.utcnow() > self.expires_at
+        return time.monotonic() > self.expires_at
 
     def touch(self) -> None:
-        self.last_accessed = datetime.utcnow()
+        self.last_accessed = time.monotonic()
 
 
 class SessionStore:
@@ -45,16 +67,38 @@ class SessionStore:
 
     Features:
     - Async save/load of session state as JSON
-    - In-memory cache with configurable TTL
-    - Auto-flush on major state transitions
+    - In-memory LRU cache with configurable TTL and capacity
+    - Write-behind saves, coalesced per flush interval
     - Session recovery for SSE reconnects
     """
 
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or get_settings()
-        self._cache: dict[UUID, CacheEntry] = {}
+        self._session_dir = self.settings.session_dir
+        # Session ids with a file on disk; scanned once at initialize and kept
+        # current by this store, which assumes it is the directory's only writer
+        self._on_disk: set[UUID] = set()
+        # Least recently used first; see _cache_put
+        self._cache: OrderedDict[UUID, CacheEntry] = OrderedDict()
         self._lock = asyncio.Lock()
         self._cache_ttl_hours = 1
+        self._cache_max = self.settings.session_cache_max
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Saved but not yet written, with the save counter at the time; holds
+        # the session so LRU eviction is safe
+        self._dirty: dict[UUID, tuple[int, SessionState]] = {}
+        self._save_count = 0
+        # Consecutive failed writes per dirty session; drives backoff and the
+        # session_write_attempts cap
+        self._write_failures: dict[UUID, int] = {}
+        # Deleted session ids, so a write already in flight cannot bring the
+        # file back; cleared when the id is created or saved again
+        self._deleted: set[UUID] = set()
+        # created_at per session seen so far; lets cleanup skip re-parsing
+        self._created_at: dict[UUID, datetime] = {}
+        self._flush_event = asyncio.Event()
+        self._flush_task: asyncio.Task[None] | None = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -64,63 +108,176 @@ class SessionStore:
 
         # Ensure session directory exists
         self.settings.ensure_session_dir()
+        files = await asyncio.to_thread(self._session_files)
+        self._on_disk = {session_id for session_id, _ in files}
+        self._flush_task = asyncio.create_task(self._flush_loop())
         self._initialized = True
         logger.info(f"Session store initialized at {self.settings.session_dir}")
 
     async def shutdown(self) -> None:
         """Shutdown and flush all cached sessions."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
         async with self._lock:
-            for session_id, entry in self._cache.items():
+            sessions = {sid: entry.session for sid, entry in self._cache.items()}
+            sessions.update((sid, session) for sid, (_, session) in self._dirty.items())
+            for session_id, session in sessions.items():
                 try:
-                    await self._write_to_disk(entry.session)
+                    await self._write_to_disk(session)
                 except Exception as e:
                     logger.error(f"Failed to flush session {session_id}: {e}")
             self._cache.clear()
+            self._dirty.clear()
+            self._write_failures.clear()
+        self._initialized = False
         logger.info("Session store shut down")
 
+    def _cache_put(self, session: SessionState) -> None:
+        """
+        Insert or refresh a cache entry, evicting least recently used ones.
+
+        Callers must hold the lock. Evicted sessions are either on disk or
+        still held in _dirty until flushed, so eviction only drops the
+        reference.
+        """
+        session_id = session.session_id
+        self._cache[session_id] = CacheEntry(session, self._cache_ttl_hours)
+        self._created_at[session_id] = session.created_at
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self._cache_max:
+            evicted, _ = self._cache.popitem(last=False)
+            logger.debug(f"Evicted session {evicted} from cache")
+
+    async def _flush_loop(self) -> None:
+        """Write dirty sessions, at most once per flush interval."""
+        while True:
+            await self._flush_event.wait()
+            # Back off exponentially while a write keeps failing
+            failures = max(self._write_failures.values(), default=0)
+            await asyncio.sleep(self.settings.session_flush_interval * 2**failures)
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Never let the loop die: later saves would pile up unwritten
+                logger.exception("Session flush failed; retrying")
+                self._flush_event.set()
+
+    async def flush(self) -> None:
+        """Write all pending saves to disk now."""
+        async with self._lock:
+            pending = list(self._dirty.items())
+
+        for session_id, (count, session) in pending:
+            try:
+                await self._write_to_disk(session)
+            except Exception as e:
+                if not isinstance(e, SessionPersistenceError):
+                    logger.exception(f"Unexpected error writing session {session_id}")
+                async with self._lock:
+                    if self._dirty.get(session_id, (None,))[0] != count:
+                        # Superseded or deleted meanwhile
+                        continue
+                    failures = self._write_failures.get(session_id, 0) + 1
+                    if failures < self.settings.session_write_attempts:
+                        # Left dirty; retried on the next flush
+                        self._write_failures[session_id] = failures
+                        self._flush_event.set()
+                        continue
+                    del self._dirty[session_id]
+                    self._write_failures.pop(session_id, None)
+                logger.error(
+                    f"Dropping pending write of session {session_id} "
+                    f"after {failures} failed attempts"
+                )
+                continue
+            # Entries stay dirty until written, so a cancelled flush loses
+            # nothing; a save made during the write keeps its entry
+            async with self._lock:
+                self._write_failures.pop(session_id, None)
+                if self._dirty.get(session_id, (None,))[0] == count:
+                    del self._dirty[session_id]
+
     def _get_path(self, session_id: UUID) -> Path:
         """Get file path for a session."""
-        return self.settings.session_dir / f"{session_id}.json"
+        return self._session_dir / f"{session_id}.json"
+
+    def _session_files(self) -> list[tuple[UUID, Path]]:
+        """List (session_id, path) for every session file in the directory."""
+        # One scandir pass; DirEntry carries the file type, so no stat per entry
+        files = []
+        with os.scandir(self._session_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".json") or not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    files.append((UUID(name[:-5]), Path(entry.path)))
+                except ValueError:
+                    pass
+        return files
 
     async def _read_from_disk(self, session_id: UUID) -> SessionState | None:
         """Read session from disk."""
-        path = self._get_path(session_id)
-        if not path.exists():
+        if session_id not in self._on_disk:
             return None
+        path = self._get_path(session_id)
 
         try:
-            async with aiofiles.open(path, "r", encoding="utf-8") as f:
-                content = await f.read()
+            content = await asyncio.to_thread(path.read_bytes)
             return SessionState.model_validate_json(content)
         except Exception as e:
             logger.error(f"Failed to read session {session_id} from disk: {e}")
             return None
 
     async def _write_to_disk(self, session: SessionState) -> None:
-        """Write session to disk."""
-        path = self._get_path(session.session_id)
+        """Write session to disk, unless it has been deleted."""
+        session_id = session.session_id
+        if session_id in self._deleted:
+            return
+        path = self._get_path(session_id)
         try:
-            content = session.model_dump_json(indent=2)
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
-                await f.write(content)
-            logger.debug(f"Session {session.session_id} written to disk")
+            # Bytes straight from the Rust serializer; no str round-trip
+            indent = 2 if self.settings.session_pretty_json else None
+            content = pydantic_core.to_json(session, indent=indent)
+            await asyncio.to_thread(
+                _write_atomic, path, content, self.settings.session_durable_writes
+            )
         except Exception as e:
-            logger.error(f"Failed to write session {session.session_id} to disk: {e}")
+            logger.error(f"Failed to write session {session_id} to disk: {e}")
             raise SessionPersistenceError(f"Failed to persist session: {e}")
 
+        if session_id in self._deleted:
+            # delete() ran during the write and found no file yet
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+            logger.debug(f"Session {session_id} deleted during write, removed")
+            return
+        self._on_disk.add(session_id)
+        logger.debug(f"Session {session_id} written to disk")
+
     async def _delete_from_disk(self, session_id: UUID) -> None:
         """Delete session from disk."""
-        path = self._get_path(session_id)
-        if path.exists():
+        if session_id in self._on_disk:
+            path = self._get_path(session_id)
             try:
-                await aiofiles.os.remove(path)
+                await asyncio.to_thread(path.unlink)
+                self._on_disk.discard(session_id)
                 logger.debug(f"Session {session_id} deleted from disk")
             except Exception as e:
                 logger.error(f"Failed to delete session {session_id}: {e}")
 
     def _is_session_expired(self, session: SessionState) -> bool:
         """Check if session has expired based on TTL."""
-        age = datetime.utcnow() - session.created_at
+        return self._is_expired_at(session.created_at)
+
+    def _is_expired_at(self, created_at: datetime) -> bool:
+        age = datetime.utcnow() - created_at
         return age > timedelta(hours=self.settings.session_ttl_hours)
 
     async def create(self, session: SessionState | None = None) -> SessionState:
@@ -139,10 +296,8 @@ class SessionStore:
             session = SessionState()
 
         async with self._lock:
-            # Add to cache
-            self._cache[session.session_id] = CacheEntry(
-                session, self._cache_ttl_hours
-            )
+            self._deleted.discard(session.session_id)
+            self._cache_put(session)
 
         # Persist to disk
         await self._write_to_disk(session)
@@ -172,15 +327,21 @@ class SessionStore:
                 entry = self._cache[session_id]
                 if not entry.is_expired():
                     entry.touch()
+                    self._cache.move_to_end(session_id)
+                    self._cache_hits += 1
                     if self._is_session_expired(entry.session):
                         raise SessionExpiredError(str(session_id))
                     return entry.session
                 else:
                     # Cache entry expired, remove it
                     del self._cache[session_id]
+            self._cache_misses += 1
+
+            # Evicted before its pending write landed
+            pending = self._dirty.get(session_id)
 
         # Not in cache, try disk
-        session = await self._read_from_disk(session_id)
+        session = pending[1] if pending else await self._read_from_disk(session_id)
         if session is None:
             raise SessionNotFoundError(str(session_id))
 
@@ -189,13 +350,16 @@ class SessionStore:
 
         # Add to cache
         async with self._lock:
-            self._cache[session_id] = CacheEntry(session, self._cache_ttl_hours)
+            self._cache_put(session)
 
         return session
 
     async def save(self, session: SessionState) -> None:
         """
-        Save a session (update cache and persist to disk).
+        Save a session (update cache and schedule a disk write).
+
+        The write happens on the next flush, so repeated saves of the same
+        session within one interval cost a single serialization.
 
         Args:
             session: Session to save
@@ -205,11 +369,12 @@ class SessionStore:
         session.touch()
 
         async with self._lock:
-            self._cache[session.session_id] = CacheEntry(
-                session, self._cache_ttl_hours
-            )
-
-        await self._write_to_disk(session)
+            self._deleted.discard(session.session_id)
+            self._write_failures.pop(session.session_id, None)
+            self._cache_put(session)
+            self._save_count += 1
+            self._dirty[session.session_id] = (self._save_count, session)
+        self._flush_event.set()
 
     async def delete(self, session_id: UUID) -> None:
         """
@@ -219,20 +384,33 @@ class SessionStore:
             session_id: Session to delete
         """
         async with self._lock:
-            if session_id in self._cache:
-                del self._cache[session_id]
+            self._forget(session_id)
 
         await self._delete_from_disk(session_id)
         logger.info(f"Deleted session {session_id}")
 
+    def _forget(self, session_id: UUID) -> None:
+        """
+        Drop all in-memory state for a removed session.
+
+        Callers must hold the lock. The tombstone stops pending and in-flight
+        writes from putting the file back.
+        """
+        self._deleted.add(session_id)
+        self._cache.pop(session_id, None)
+        self._dirty.pop(session_id, None)
+        self._write_failures.pop(session_id, None)
+        self._created_at.pop(session_id, None)
+
     async def exists(self, session_id: UUID) -> bool:
         """Check if a session exists."""
+        await self.initialize()
         async with self._lock:
-            if session_id in self._cache:
-                return True
-
-        path = self._get_path(session_id)
-        return path.exists()
+            return (
+                session_id in self._cache
+                or session_id in self._dirty
+                or session_id in self._on_disk
+            )
 
     async def cleanup_expired(self) -> int:
         """
@@ -252,16 +430,31 @@ class SessionStore:
             for sid in expired_cache:
                 del self._cache[sid]
                 cleaned += 1
+            # Expired sessions not yet on disk must not be written there
+            expired_dirty = [
+                sid
+                for sid, (_, session) in self._dirty.items()
+                if self._is_session_expired(session)
+            ]
+            for sid in expired_dirty:
+                self._forget(sid)
 
-        # Clean disk
+        # Clean disk; created_at never changes, so each file is parsed at most
+        # once per process and later sweeps are a directory listing
         try:
-            for path in self.settings.session_dir.glob("*.json"):
+            files = await asyncio.to_thread(self._session_files)
+            for session_id, path in files:
                 try:
-                    async with aiofiles.open(path, "r", encoding="utf-8") as f:
-                        content = await f.read()
-                    session = SessionState.model_validate_json(content)
-                    if self._is_session_expired(session):
-                        await aiofiles.os.remove(path)
+                    created_at = self._created_at.get(session_id)
+                    if created_at is None:
+                        content = await asyncio.to_thread(path.read_bytes)
+                        created_at = SessionState.model_validate_json(content).created_at
+                        self._created_at[session_id] = created_at
+                    if self._is_expired_at(created_at):
+                        async with self._lock:
+                            self._forget(session_id)
+                        await asyncio.to_thread(path.unlink)
+                        self._on_disk.discard(session_id)
                         cleaned += 1
                         logger.debug(f"Cleaned up expired session {path.stem}")
                 except Exception as e:
@@ -278,18 +471,8 @@ class SessionStore:
         """List all session IDs."""
         await self.initialize()
 
-        session_ids = set()
-
-        # From cache
         async with self._lock:
-            session_ids.update(self._cache.keys())
-
-        # From disk
-        for path in self.settings.session_dir.glob("*.json"):
-            try:
-                session_ids.add(UUID(path.stem))
-            except ValueError:
-                pass
+            session_ids = self._on_disk | self._cache.keys() | self._dirty.keys()
 
         return list(session_ids)
 
@@ -297,8 +480,12 @@ class SessionStore:
         """Get cache statistics."""
         return {
             "cached_sessions": len(self._cache),
+            "cache_max": self._cache_max,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "pending_writes": len(self._dirty),
             "cache_ttl_hours": self._cache_ttl_hours,
-            "session_dir": str(self.settings.session_dir),
+            "session_dir": str(self._session_dir),
             "session_ttl_hours": self.settings.session_ttl_hours,
         }
 
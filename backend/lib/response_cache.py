@@ -0,0 +1,110 @@
+"""Disk-backed cache for deterministic LLM completions.
+
+Identical temperature-0 requests (red-team re-checks, test replays) are
+answered from a local SQLite table instead of the provider.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    SQLite-backed key/value store for serialized LLM responses.
+
+    Entries expire after ``ttl`` seconds. The database is opened lazily on
+    first use and all blocking I/O runs in a worker thread.
+    """
+
+    def __init__(self, path: Path, ttl: float = 3600.0):
+        self.path = path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, Any]],
+        system: Any,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """Hash the request parameters that determine a completion."""
+        payload = orjson.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "system": system,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _get_sync(self, key: str) -> dict[str, Any] | None:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at < time.time():
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+            return None
+        return orjson.loads(value)
+
+    def _set_sync(self, key: str, value: dict[str, Any]) -> None:
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, orjson.dumps(value), time.time() + self.ttl),
+        )
+        conn.commit()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response fields for key, or None on miss/expiry."""
+        async with self._lock:
+            try:
+                return await asyncio.to_thread(self._get_sync, key)
+            except (sqlite3.Error, orjson.JSONDecodeError) as e:
+                logger.warning(f"Response cache read failed: {e}")
+                return None
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store response fields under key; failures are logged, not raised."""
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._set_sync, key, value)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -4,13 +4,13 @@ Provides utilities for Server-Sent Events with sequencing and state tracking.
 """
 
 import asyncio
-import json
 import logging
-from datetime import datetime
+from bisect import bisect_right
+from itertools import islice
+from operator import attrgetter
 from typing import Any, AsyncIterator, Callable
-from uuid import uuid4
 
-from sse_starlette.sse import ServerSentEvent
+import orjson
 
 from backend.lib.models import ScenarioSheet, SessionState, SSEEvent, TokenUsage
 
@@ -90,14 +90,12 @@ class EventBuilder:
         sheet_version, sheet_hash = self._get_sheet_info()
 
         return SSEEvent(
-            event_id=str(uuid4()),
             sequence=self.session.next_sse_sequence(),
             event_type=event_type,
             data=data or {},
             sheet_version=sheet_version,
             sheet_hash=sheet_hash,
             token_usage=token_usage,
-            timestamp=datetime.utcnow(),
         )
 
     def session_start(self) -> SSEEvent:
@@ -263,28 +261,25 @@ class EventBuilder:
 # =============================================================================
 
 
-def format_sse(event: SSEEvent) -> ServerSentEvent:
+def format_sse(event: SSEEvent) -> bytes:
     """Format an SSEEvent for transmission via sse-starlette.
 
-    Returns a ServerSentEvent object that sse-starlette will format correctly.
+    Returns the encoded frame; sse-starlette writes bytes through unchanged,
+    so the event is serialized once with orjson and never round-trips via str.
     We do NOT set the 'event' field because EventSource.onmessage only receives
     events WITHOUT a custom event type. The event_type is in the JSON data.
     """
-    data = event.model_dump(mode="json")
-    return ServerSentEvent(
-        data=json.dumps(data),
-        id=event.event_id,
-    )
+    return event.sse_payload()
 
 
-def format_sse_simple(event_type: str, data: Any) -> ServerSentEvent:
-    """Format a simple SSE event via sse-starlette.
+def format_sse_simple(event_type: str, data: Any) -> bytes:
+    """Format a simple SSE event as an encoded frame.
 
-    Returns a ServerSentEvent object. We do NOT set the 'event' field because
-    EventSource.onmessage only receives events WITHOUT a custom event type.
+    As with format_sse, no 'event' field is set because EventSource.onmessage
+    only receives events WITHOUT a custom event type.
     """
     payload = {"event_type": event_type, "data": data}
-    return ServerSentEvent(data=json.dumps(payload))
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
 
 
 # =============================================================================
@@ -298,10 +293,14 @@ class SSEStream:
 
     Supports:
     - Automatic heartbeats
-    - Event buffering
+    - Event buffering, with queued events sent as one write
     - Reconnection from sequence number
     """
 
+    # Bounds for the number of queued events merged into one yielded chunk
+    MIN_BATCH = 8
+    MAX_BATCH = 128
+
     def __init__(
         self,
         session: SessionState,
@@ -313,6 +312,7 @@ class SSEStream:
         self._queue: asyncio.Queue[SSEEvent | None] = asyncio.Queue()
         self._closed = False
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._batch_limit = self.MIN_BATCH
 
     async def start(self) -> None:
         """Start the stream (including heartbeat task)."""
@@ -354,15 +354,43 @@ class SSEStream:
         except asyncio.CancelledError:
             pass
 
-    async def __aiter__(self) -> AsyncIterator[ServerSentEvent]:
-        """Iterate over ServerSentEvent objects."""
+    def _drain(self, first: SSEEvent) -> tuple[bytes, bool]:
+        """
+        Encode first plus whatever is already queued, up to the batch limit.
+
+        Returns the joined frames and whether the end-of-stream marker was
+        reached. The limit doubles while bursts fill it and halves when they
+        don't, so idle streams still send each event immediately.
+        """
+        frames = [format_sse(first)]
+        queue = self._queue
+        limit = self._batch_limit
+        ended = False
+        while len(frames) < limit and not queue.empty():
+            event = queue.get_nowait()
+            if event is None:
+                ended = True
+                break
+            frames.append(format_sse(event))
+
+        if len(frames) >= limit:
+            self._batch_limit = min(limit * 2, self.MAX_BATCH)
+        elif len(frames) < limit // 2:
+            self._batch_limit = max(limit // 2, self.MIN_BATCH)
+        return b"".join(frames), ended
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate over encoded SSE frames, batching events that queue up."""
         await self.start()
         try:
             while True:
                 event = await self._queue.get()
                 if event is None:
                     break
-                yield format_sse(event)
+                chunk, ended = self._drain(event)
+                yield chunk
+                if ended:
+                    break
         finally:
             await self.close()
 
@@ -376,18 +404,19 @@ async def replay_events_from_sequence(
     session: SessionState,
     from_sequence: int,
     event_history: list[SSEEvent],
-) -> AsyncIterator[ServerSentEvent]:
+) -> AsyncIterator[bytes]:
     """
     Replay events from a given sequence number for SSE reconnection.
 
     Args:
         session: Current session state
         from_sequence: Last received sequence number
-        event_history: List of past events
+        event_history: List of past events, in sequence order
 
     Yields:
-        ServerSentEvent objects for missed events
+        Encoded SSE frames for missed events
     """
-    for event in event_history:
-        if event.sequence > from_sequence:
-            yield format_sse(event)
+    # Sequences are assigned monotonically, so seek instead of scanning
+    start = bisect_right(event_history, from_sequence, key=attrgetter("sequence"))
+    for event in islice(event_history, start, None):
+        yield format_sse(event)
@@ -1,5 +1,6 @@
 """Utility functions for the Consilium backend."""
 
+from functools import lru_cache
 from typing import Any
 
 
@@ -167,3 +168,18 @@ def safe_get(obj: Any, *keys: str, default: Any = None) -> Any:
         else:
             obj = getattr(obj, key, None)
     return obj if obj is not None else default
+
+
+@lru_cache(maxsize=256)
+def split_path(path: str) -> tuple[str, ...]:
+    """
+    Split a dot-notation field path into its parts.
+
+    Deltas and ownership patterns reuse a small set of paths every round, so
+    each distinct path is split once and the tuple is shared.
+
+    Examples:
+        >>> split_path("forces.side_a.commander")
+        ('forces', 'side_a', 'commander')
+    """
+    return tuple(path.split("."))
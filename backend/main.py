@@ -2,11 +2,13 @@
 
 import logging
 from contextlib import asynccontextmanager
+from functools import cache
 from typing import Any, AsyncIterator
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from backend.api.routes import router as api_router
 from backend.config import get_settings
@@ -52,6 +54,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Session directory: {settings.session_dir}")
 
+    # Build the static response bodies now so no request pays for it
+    _health_payload()
+    _config_payload()
+
     # Initialize session store
     store = await get_session_store()
     logger.info(f"Session store initialized: {store.get_cache_stats()}")
@@ -72,6 +78,40 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Shutdown complete")
 
 
+# =============================================================================
+# Static Payloads
+# =============================================================================
+
+
+@cache
+def _health_payload() -> bytes:
+    """Serialized /health body; constant for the process lifetime."""
+    return orjson.dumps(HealthResponse(status="ok", version="0.1.0").model_dump(mode="json"))
+
+
+@cache
+def _config_payload() -> bytes:
+    """Serialized /api/config body; the option enums never change at runtime."""
+    config = ConfigResponse(
+        eras=[{"value": e.value, "label": e.value.replace("_", " ").title()} for e in Era],
+        terrain_types=[
+            {"value": t.value, "label": t.value.replace("_", " ").title()}
+            for t in TerrainType
+        ],
+        violence_levels=[
+            {"value": v.value, "label": v.value.title()} for v in ViolenceLevel
+        ],
+        commander_competence=[
+            {"value": c.value, "label": c.value.title()} for c in CommanderCompetence
+        ],
+        narrative_outcomes=[
+            {"value": n.value, "label": n.value.replace("_", " ").title()}
+            for n in NarrativeOutcome
+        ],
+    )
+    return orjson.dumps(config.model_dump(mode="json"))
+
+
 # =============================================================================
 # Application Factory
 # =============================================================================
@@ -105,31 +145,16 @@ def create_app() -> FastAPI:
     app.include_router(api_router, prefix="/api")
 
     # Root endpoints
+    # Both bodies are pre-serialized; response_model only documents the schema
     @app.get("/health", response_model=HealthResponse, tags=["Health"])
-    async def health_check() -> HealthResponse:
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return HealthResponse(status="ok", version="0.1.0")
+        return Response(_health_payload(), media_type="application/json")
 
     @app.get("/api/config", response_model=ConfigResponse, tags=["Config"])
-    async def get_config() -> ConfigResponse:
+    async def get_config() -> Response:
         """Get available configuration options."""
-        return ConfigResponse(
-            eras=[{"value": e.value, "label": e.value.replace("_", " ").title()} for e in Era],
-            terrain_types=[
-                {"value": t.value, "label": t.value.replace("_", " ").title()}
-                for t in TerrainType
-            ],
-            violence_levels=[
-                {"value": v.value, "label": v.value.title()} for v in ViolenceLevel
-            ],
-            commander_competence=[
-                {"value": c.value, "label": c.value.title()} for c in CommanderCompetence
-            ],
-            narrative_outcomes=[
-                {"value": n.value, "label": n.value.replace("_", " ").title()}
-                for n in NarrativeOutcome
-            ],
-        )
+        return Response(_config_payload(), media_type="application/json")
 
     return app
 
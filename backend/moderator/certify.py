@@ -33,10 +33,10 @@ async def check_certification(
     """
     # Check consistency - be lenient with violations from LLM output
     try:
-        violations = check_all_consistency(sheet)
-        if has_blocking_violations(violations):
+        report = check_all_consistency(sheet)
+        if has_blocking_violations(report):
             # Only block on truly critical violations (> 5)
-            critical_count = len([v for v in violations if v.severity == "error"])
+            critical_count = report.error_count
             if critical_count > 5:
                 return False, f"Too many critical consistency violations: {critical_count}"
     except Exception as e:
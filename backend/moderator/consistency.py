@@ -36,14 +36,14 @@ async def run_consistency_pass(
     Returns:
         List of consistency violations found
     """
-    violations = check_all_consistency(sheet)
+    report = check_all_consistency(sheet)
 
     # Log summary
-    errors = filter_violations_by_severity(violations, "error")
-    warnings = filter_violations_by_severity(violations, "warning")
-    logger.info(f"Consistency check: {len(errors)} errors, {len(warnings)} warnings")
+    logger.info(
+        f"Consistency check: {report.error_count} errors, {report.warning_count} warnings"
+    )
 
-    return violations
+    return report.violations
 
 
 async def resolve_contradictions(
@@ -5,10 +5,12 @@ Applies approved delta requests to the ScenarioSheet.
 Phase 2 implementation.
 """
 
-from typing import Any
+from typing import Any, Final
 
 from backend.lib.models import DeltaOperation, DeltaRequest, ScenarioSheet
-from backend.lib.utils import enum_value
+from backend.lib.utils import enum_value, split_path
+
+_MISSING: Final = object()
 
 
 def _normalize_operation(op: DeltaOperation | str) -> str:
@@ -33,13 +35,15 @@ def apply_delta(
         (success, message) tuple
     """
     try:
-        field_path = delta.field.split(".")
-        target = sheet
+        field_path = split_path(delta.field)
+        target: Any = sheet
 
-        # Navigate to parent of target field
+        # Navigate to parent of target field; one getattr per level instead of
+        # hasattr followed by getattr
         for part in field_path[:-1]:
-            if hasattr(target, part):
-                target = getattr(target, part)
+            child = getattr(target, part, _MISSING)
+            if child is not _MISSING:
+                target = child
             elif isinstance(target, dict):
                 target = target[part]
             else:
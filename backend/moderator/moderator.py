@@ -26,7 +26,7 @@ from backend.lib.models import (
     TokenUsage,
 )
 from backend.lib.streaming import EventBuilder, EventType
-from backend.lib.utils import enum_value
+from backend.lib.utils import enum_value, split_path
 from backend.moderator.consistency import (
     is_certified_ready,
     resolve_contradictions,
@@ -84,6 +84,14 @@ FIELD_OWNERSHIP: dict[str, list[str]] = {
     "forces.*.objectives": ["herald"],
 }
 
+# Moderator's classification labels -> ObjectionType
+OBJECTION_TYPE_LABELS: dict[str, ObjectionType] = {
+    "STRUCTURAL": ObjectionType.STRUCTURAL,
+    "REFINABLE": ObjectionType.REFINABLE,
+    "CONSIDERATION": ObjectionType.COSMETIC,  # Map to cosmetic
+    "NITPICK": ObjectionType.DISMISSED,
+}
+
 
 # =============================================================================
 # Delta Applicator
@@ -105,6 +113,8 @@ class DeltaApplicator:
             ownership_map: Field ownership mapping. Uses default if not provided.
         """
         self.ownership_map = ownership_map or FIELD_OWNERSHIP
+        # Field path -> owners of the first matching pattern (None: unowned)
+        self._owners_cache: dict[str, list[str] | None] = {}
 
     def validate_delta(
         self,
@@ -121,23 +131,31 @@ class DeltaApplicator:
         Returns:
             Tuple of (is_valid, reason)
         """
-        field = delta.field
-
-        # Check if field has explicit ownership
-        for pattern, owners in self.ownership_map.items():
-            if self._field_matches_pattern(field, pattern):
-                if expert in owners:
-                    return True, "within_jurisdiction"
-                else:
-                    return False, f"field owned by {', '.join(owners)}, not {expert}"
+        owners = self._owners_for(delta.field)
 
         # Field not in map - allow if no explicit restriction
-        return True, "no_explicit_restriction"
+        if owners is None:
+            return True, "no_explicit_restriction"
+        if expert in owners:
+            return True, "within_jurisdiction"
+        return False, f"field owned by {', '.join(owners)}, not {expert}"
+
+    def _owners_for(self, field: str) -> list[str] | None:
+        """Owners of the first ownership pattern matching field, cached per path."""
+        if field in self._owners_cache:
+            return self._owners_cache[field]
+        owners = None
+        for pattern, pattern_owners in self.ownership_map.items():
+            if self._field_matches_pattern(field, pattern):
+                owners = pattern_owners
+                break
+        self._owners_cache[field] = owners
+        return owners
 
     def _field_matches_pattern(self, field: str, pattern: str) -> bool:
         """Check if a field path matches a pattern (supports * wildcard)."""
-        field_parts = field.split(".")
-        pattern_parts = pattern.split(".")
+        field_parts = split_path(field)
+        pattern_parts = split_path(pattern)
 
         if len(field_parts) < len(pattern_parts):
             return False
@@ -223,7 +241,7 @@ class DeltaApplicator:
 
     def _get_nested_field(self, obj: Any, field: str) -> Any:
         """Get a nested field value using dot notation."""
-        parts = field.split(".")
+        parts = split_path(field)
         current = obj
 
         for part in parts:
@@ -238,7 +256,7 @@ class DeltaApplicator:
 
     def _set_nested_field(self, obj: Any, field: str, value: Any) -> None:
         """Set a nested field value using dot notation."""
-        parts = field.split(".")
+        parts = split_path(field)
 
         # Navigate to parent
         current = obj
@@ -478,14 +496,7 @@ class RedTeamFilter:
 
     def _parse_objection_type(self, type_str: str) -> ObjectionType:
         """Parse objection type string to enum."""
-        type_str = type_str.upper().strip()
-        mapping = {
-            "STRUCTURAL": ObjectionType.STRUCTURAL,
-            "REFINABLE": ObjectionType.REFINABLE,
-            "CONSIDERATION": ObjectionType.COSMETIC,  # Map to cosmetic
-            "NITPICK": ObjectionType.DISMISSED,
-        }
-        return mapping.get(type_str, ObjectionType.REFINABLE)
+        return OBJECTION_TYPE_LABELS.get(type_str.upper().strip(), ObjectionType.REFINABLE)
 
     def _heuristic_filter(
         self,
@@ -149,10 +149,7 @@ class ConsiliumChamber(ChamberManager):
                 contributions.append(contribution)
 
                 # Accumulate token usage
-                total_usage.input_tokens += usage.input_tokens
-                total_usage.output_tokens += usage.output_tokens
-                total_usage.cache_read_tokens += usage.cache_read_tokens
-                total_usage.cache_creation_tokens += usage.cache_creation_tokens
+                total_usage += usage
 
                 # Emit contribution event
                 if event_builder and emit_callback:
@@ -271,10 +268,7 @@ class RedTeamChamber(ChamberManager):
                 objections.extend(expert_objections)
 
                 # Accumulate token usage
-                total_usage.input_tokens += usage.input_tokens
-                total_usage.output_tokens += usage.output_tokens
-                total_usage.cache_read_tokens += usage.cache_read_tokens
-                total_usage.cache_creation_tokens += usage.cache_creation_tokens
+                total_usage += usage
 
         else:
             # Run sequentially
@@ -291,10 +285,7 @@ class RedTeamChamber(ChamberManager):
                     objections.extend(expert_objections)
 
                     # Accumulate token usage
-                    total_usage.input_tokens += usage.input_tokens
-                    total_usage.output_tokens += usage.output_tokens
-                    total_usage.cache_read_tokens += usage.cache_read_tokens
-                    total_usage.cache_creation_tokens += usage.cache_creation_tokens
+                    total_usage += usage
 
                 except Exception as e:
                     logger.error(f"Red team expert failed: {e}")
@@ -197,10 +197,7 @@ class RoundExecutor:
 
     def _accumulate_usage(self, total: TokenUsage, new: TokenUsage) -> None:
         """Accumulate token usage."""
-        total.input_tokens += new.input_tokens
-        total.output_tokens += new.output_tokens
-        total.cache_read_tokens += new.cache_read_tokens
-        total.cache_creation_tokens += new.cache_creation_tokens
+        total += new
 
 
 # =============================================================================
@@ -373,10 +370,7 @@ class DeliberationEngine:
 
     def _accumulate_session_usage(self, usage: TokenUsage) -> None:
         """Accumulate token usage into session totals."""
-        self.session.total_token_usage.input_tokens += usage.input_tokens
-        self.session.total_token_usage.output_tokens += usage.output_tokens
-        self.session.total_token_usage.cache_read_tokens += usage.cache_read_tokens
-        self.session.total_token_usage.cache_creation_tokens += usage.cache_creation_tokens
+        self.session.total_token_usage += usage
 
     def _get_blocking_issues(
         self,
@@ -0,0 +1,153 @@
+"""
+Consistency check tests.
+
+Covers causal cycle detection in the timeline check and severity filtering.
+"""
+
+import asyncio
+import sys
+
+# Configure stdout for unicode support on Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# Add parent to path for imports
+sys.path.insert(0, str(__file__).rsplit("\\", 2)[0])
+
+
+def _timeline_sheet(links: list[tuple[str, str]]):
+    """Build a sheet whose timeline has one event per (event, triggered_by)."""
+    from backend.lib.models import ScenarioSheet, TimelineEvent
+
+    return ScenarioSheet(
+        timeline=[TimelineEvent(event=event, triggered_by=cause) for event, cause in links]
+    )
+
+
+async def test_causal_cycle():
+    """Test that the timeline check reports trigger cycles."""
+    print("\n" + "=" * 60)
+    print("TEST: Causal Cycle Detection")
+    print("=" * 60)
+
+    from backend.lib.consistency import check_timeline_consistency
+
+    sheet = _timeline_sheet([
+        ("Scouts sighted", ""),
+        ("Vanguard advances", "Rearguard retreats"),
+        ("Flank exposed", "Vanguard advances"),
+        ("Rearguard retreats", "Flank exposed"),
+        ("Reserves commit", "Flank exposed"),  # downstream of the cycle only
+    ])
+    cycles = [
+        v for v in check_timeline_consistency(sheet) if v.violation_type == "causal_cycle"
+    ]
+    assert len(cycles) == 1, cycles
+    assert cycles[0].severity == "error"
+    assert cycles[0].field == "timeline"
+    assert cycles[0].description.endswith(
+        "Vanguard advances -> Flank exposed -> Rearguard retreats -> Vanguard advances"
+    ), cycles[0].description
+    assert "Reserves commit" not in cycles[0].description
+    assert "Scouts sighted" not in cycles[0].description
+    print(f"[OK] {cycles[0].description}")
+
+    acyclic = _timeline_sheet([
+        ("Scouts sighted", ""),
+        ("Vanguard advances", "Scouts sighted"),
+        ("Flank exposed", "Vanguard advances"),
+    ])
+    assert not any(
+        v.violation_type == "causal_cycle" for v in check_timeline_consistency(acyclic)
+    )
+    print("[OK] Acyclic timeline has no cycle violation")
+
+
+async def test_find_cycle_paths():
+    """Test cycle path reconstruction on the leftover graph."""
+    print("\n" + "=" * 60)
+    print("TEST: Cycle Paths")
+    print("=" * 60)
+
+    from backend.lib.consistency import _find_cycle_paths
+
+    graph = {
+        "a": ["b"],
+        "b": ["c", "x"],
+        "c": ["a"],
+        "d": ["d"],
+        "x": [],
+    }
+    # Kahn's sort leaves every node with in-degree > 0; x is not on a cycle
+    cycles = _find_cycle_paths(graph, ["a", "b", "c", "d"])
+    assert cycles == [["a", "b", "c", "a"], ["d", "d"]], cycles
+    print("[OK] Disjoint cycles and self-loops reported once each")
+
+    # Same cycle entered from another node is not reported twice
+    assert _find_cycle_paths(graph, ["b", "c", "a"]) == [["b", "c", "a", "b"]]
+    print("[OK] Rotations of a cycle are deduplicated")
+
+
+async def test_severity_filtering():
+    """Test severity helpers on violations built outside the checks."""
+    print("\n" + "=" * 60)
+    print("TEST: Severity Filtering")
+    print("=" * 60)
+
+    from backend.lib.consistency import (
+        ViolationReport,
+        filter_violations_by_severity,
+        has_blocking_violations,
+    )
+    from backend.lib.models import ConsistencyViolation
+
+    def make(severity: str) -> ConsistencyViolation:
+        return ConsistencyViolation.model_construct(
+            field="timeline", violation_type="x", description="d", severity=severity
+        )
+
+    # Built at runtime, so not the module's interned constants
+    error = "".join(["err", "or"])
+    warning = "".join(["warn", "ing"])
+    violations = [make(warning), make(error), make(warning)]
+
+    assert has_blocking_violations(violations)
+    assert not has_blocking_violations([make(warning)])
+    assert filter_violations_by_severity(violations, "error") == [violations[1]]
+    assert filter_violations_by_severity(violations, "warning") == [
+        violations[0],
+        violations[2],
+    ]
+
+    report = ViolationReport()
+    report.extend(violations)
+    assert (report.error_count, report.warning_count) == (1, 2)
+    print("[OK] Severity compared by value, not identity")
+
+
+async def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print(" CONSISTENCY TESTS ")
+    print("=" * 60)
+
+    try:
+        await test_causal_cycle()
+        await test_find_cycle_paths()
+        await test_severity_filtering()
+
+        print("\n" + "=" * 60)
+        print(" ALL TESTS PASSED! ")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n[ERROR] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    result = asyncio.run(main())
+    sys.exit(result)
@@ -0,0 +1,251 @@
+"""
+Session persistence tests.
+
+Runs SessionStore against a temporary directory; no API calls.
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Configure stdout for unicode support on Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# Add parent to path for imports
+sys.path.insert(0, str(__file__).rsplit("\\", 2)[0])
+
+
+def _make_store(**overrides):
+    """Create a store over a fresh temp dir; by default the flush loop stays idle."""
+    from backend.config import Settings
+    from backend.lib.persistence import SessionStore
+
+    overrides.setdefault("session_flush_interval", 60.0)
+    settings = Settings(session_dir=Path(tempfile.mkdtemp()), **overrides)
+    return SessionStore(settings)
+
+
+async def test_lru_eviction():
+    """Test that the cache keeps the most recently used sessions."""
+    print("\n" + "=" * 60)
+    print("TEST: LRU Eviction")
+    print("=" * 60)
+
+    store = _make_store(session_cache_max=2)
+    a = await store.create()
+    b = await store.create()
+
+    await store.get(a.session_id)  # a is now most recently used
+    c = await store.create()
+    assert list(store._cache) == [a.session_id, c.session_id]
+    print("[OK] Least recently used session evicted")
+
+    # Evicted sessions still load, from disk
+    misses = store._cache_misses
+    loaded = await store.get(b.session_id)
+    assert loaded.session_id == b.session_id
+    assert store._cache_misses == misses + 1
+    assert list(store._cache) == [c.session_id, b.session_id]
+    assert store.get_cache_stats()["cached_sessions"] == 2
+    print("[OK] Evicted session reloaded from disk")
+
+    await store.shutdown()
+
+
+async def test_write_behind():
+    """Test that saves are coalesced and flushed after the interval."""
+    print("\n" + "=" * 60)
+    print("TEST: Write-Behind Flush")
+    print("=" * 60)
+
+    from backend.lib.models import SessionState
+
+    store = _make_store(session_cache_max=1, session_flush_interval=0.05)
+    session = await store.create()
+    path = store._get_path(session.session_id)
+
+    session.max_rounds = 7
+    for _ in range(20):
+        await store.save(session)
+    assert store.get_cache_stats()["pending_writes"] == 1
+    assert SessionState.model_validate_json(path.read_bytes()).max_rounds != 7
+    print("[OK] Saves are pending, not yet on disk")
+
+    # Evicting a dirty session must not lose its pending write
+    await store.create()
+    assert session.session_id not in store._cache
+    assert (await store.get(session.session_id)).max_rounds == 7
+    print("[OK] Evicted dirty session served from pending writes")
+
+    await asyncio.sleep(0.3)
+    assert store.get_cache_stats()["pending_writes"] == 0
+    assert SessionState.model_validate_json(path.read_bytes()).max_rounds == 7
+    print("[OK] Flushed after the interval")
+
+    session.max_rounds = 9
+    await store.save(session)
+    await store.shutdown()
+    assert SessionState.model_validate_json(path.read_bytes()).max_rounds == 9
+    print("[OK] Shutdown writes pending saves")
+
+
+async def test_flush_loop_survives_errors():
+    """Test that an unexpected flush error does not stop later writes."""
+    print("\n" + "=" * 60)
+    print("TEST: Flush Loop Survives Errors")
+    print("=" * 60)
+
+    from backend.lib.models import SessionState
+
+    store = _make_store(session_flush_interval=0.02)
+    session = SessionState()
+    real_write = store._write_to_disk
+    calls = {"count": 0}
+
+    async def flaky_write(s):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("unexpected")
+        await real_write(s)
+
+    store._write_to_disk = flaky_write
+    await store.save(session)
+    await asyncio.sleep(0.3)
+
+    assert not store._flush_task.done()
+    assert store._get_path(session.session_id).exists()
+    assert store.get_cache_stats()["pending_writes"] == 0
+    print(f"[OK] Written after {calls['count']} attempts; loop still running")
+
+    await store.shutdown()
+
+
+async def test_cleanup_drops_pending_writes():
+    """Test that cleanup of an expired session also cancels its pending write."""
+    print("\n" + "=" * 60)
+    print("TEST: Cleanup Drops Pending Writes")
+    print("=" * 60)
+
+    from datetime import datetime, timedelta
+
+    from backend.lib.models import SessionState
+
+    store = _make_store()
+    session = SessionState(created_at=datetime.utcnow() - timedelta(days=30))
+    await store.create(session)
+    path = store._get_path(session.session_id)
+    await store.save(session)
+    assert path.exists() and session.session_id in store._dirty
+
+    assert await store.cleanup_expired() >= 1
+    assert session.session_id not in store._dirty
+    assert not path.exists()
+
+    await store.flush()
+    assert not path.exists()
+    print("[OK] Expired session stays deleted after a flush")
+
+    await store.shutdown()
+
+
+async def test_delete_during_write():
+    """Test that a write in flight cannot resurrect a deleted session."""
+    print("\n" + "=" * 60)
+    print("TEST: Delete During Write")
+    print("=" * 60)
+
+    from backend.lib import persistence
+    from backend.lib.models import SessionState
+
+    store = _make_store()
+    session = SessionState()
+    await store.save(session)
+    path = store._get_path(session.session_id)
+
+    real_write = persistence._write_atomic
+
+    def slow_write(*args):
+        time.sleep(0.2)
+        real_write(*args)
+
+    with patch.object(persistence, "_write_atomic", slow_write):
+        flush = asyncio.create_task(store.flush())
+        await asyncio.sleep(0.05)
+        await store.delete(session.session_id)
+        await flush
+
+    assert not path.exists()
+    assert not await store.exists(session.session_id)
+    print("[OK] Deleted session stays deleted")
+
+    await store.save(session)
+    await store.flush()
+    assert path.exists()
+    print("[OK] Saving again clears the tombstone")
+
+    await store.shutdown()
+
+
+async def test_write_retry_cap():
+    """Test that a write that keeps failing is eventually dropped."""
+    print("\n" + "=" * 60)
+    print("TEST: Write Retry Cap")
+    print("=" * 60)
+
+    from backend.lib import persistence
+    from backend.lib.models import SessionState
+
+    store = _make_store(session_write_attempts=3)
+    session = SessionState()
+    await store.save(session)
+
+    def failing_write(*args):
+        raise OSError("disk full")
+
+    with patch.object(persistence, "_write_atomic", failing_write):
+        for attempt in range(1, 3):
+            await store.flush()
+            assert session.session_id in store._dirty
+            assert store._write_failures[session.session_id] == attempt
+        await store.flush()
+
+    assert session.session_id not in store._dirty
+    assert session.session_id not in store._write_failures
+    print("[OK] Pending write dropped after 3 attempts")
+
+    await store.shutdown()
+
+
+async def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print(" PERSISTENCE TESTS ")
+    print("=" * 60)
+
+    try:
+        await test_lru_eviction()
+        await test_write_behind()
+        await test_delete_during_write()
+        await test_write_retry_cap()
+        await test_flush_loop_survives_errors()
+        await test_cleanup_drops_pending_writes()
+
+        print("\n" + "=" * 60)
+        print(" ALL TESTS PASSED! ")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n[ERROR] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    result = asyncio.run(main())
+    sys.exit(result)
@@ -0,0 +1,137 @@
+"""
+Response cache tests.
+
+Exercises ResponseCache against a temporary SQLite file and checks that
+LLMClient only consults it for temperature-0 calls. No API calls are made.
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+# Configure stdout for unicode support on Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# Add parent to path for imports
+sys.path.insert(0, str(__file__).rsplit("\\", 2)[0])
+
+
+def _cache_path() -> Path:
+    return Path(tempfile.mkdtemp()) / "responses.sqlite"
+
+
+async def test_make_key():
+    """Test key derivation from request parameters."""
+    print("\n" + "=" * 60)
+    print("TEST: Key Derivation")
+    print("=" * 60)
+
+    from backend.lib.response_cache import ResponseCache
+
+    messages = [{"role": "user", "content": "Hold the ford?"}]
+    other = [{"role": "user", "content": "Cross the ford?"}]
+    key = ResponseCache.make_key("gpt-4o", messages, "You are a tactician", 512, 0.0)
+
+    # Dict key order does not matter
+    reordered = [{"content": "Hold the ford?", "role": "user"}]
+    assert ResponseCache.make_key("gpt-4o", reordered, "You are a tactician", 512, 0.0) == key
+
+    variants = [
+        ("gpt-4o-mini", messages, "You are a tactician", 512, 0.0),
+        ("gpt-4o", other, "You are a tactician", 512, 0.0),
+        ("gpt-4o", messages, "You are a logistician", 512, 0.0),
+        ("gpt-4o", messages, "You are a tactician", 1024, 0.0),
+        ("gpt-4o", messages, "You are a tactician", 512, 0.5),
+    ]
+    keys = {ResponseCache.make_key(*args) for args in variants}
+    assert key not in keys and len(keys) == len(variants)
+    print("[OK] Key is stable and changes with every parameter")
+
+
+async def test_ttl_expiry():
+    """Test that entries expire after the TTL."""
+    print("\n" + "=" * 60)
+    print("TEST: TTL Expiry")
+    print("=" * 60)
+
+    from backend.lib.response_cache import ResponseCache
+
+    cache = ResponseCache(_cache_path(), ttl=0.2)
+    await cache.set("k", {"content": "hold"})
+    assert await cache.get("k") == {"content": "hold"}
+    assert await cache.get("missing") is None
+    print("[OK] Fresh entry is returned")
+
+    await asyncio.sleep(0.3)
+    assert await cache.get("k") is None
+    print("[OK] Expired entry is not returned")
+
+    cache.close()
+
+
+async def test_temperature_gating():
+    """Test that only temperature-0 completions are cached."""
+    print("\n" + "=" * 60)
+    print("TEST: Temperature Gating")
+    print("=" * 60)
+
+    from backend.config import ModelProvider, Settings
+    from backend.lib.llm import LLMClient, LLMResponse
+    from backend.lib.models import TokenUsage
+
+    settings = Settings(response_cache_path=_cache_path())
+    client = LLMClient(settings, enable_response_cache=True)
+    provider_call = AsyncMock(
+        return_value=LLMResponse(
+            content="Hold the ford.",
+            token_usage=TokenUsage(input_tokens=10, output_tokens=5, model="gpt-4o"),
+            model="gpt-4o",
+        )
+    )
+    client._complete_by_provider[ModelProvider.OPENAI] = provider_call
+    messages = [{"role": "user", "content": "Hold the ford?"}]
+
+    first = await client.complete("gpt-4o", messages, temperature=0.0)
+    second = await client.complete("gpt-4o", messages, temperature=0.0)
+    assert provider_call.await_count == 1
+    assert second.content == first.content
+    assert second.token_usage.total_tokens == 15
+    print("[OK] Temperature 0.0 repeat served from cache")
+
+    await client.complete("gpt-4o", messages, temperature=0.7)
+    await client.complete("gpt-4o", messages, temperature=0.7)
+    assert provider_call.await_count == 3
+    print("[OK] Temperature 0.7 always calls the provider")
+
+    await client.close()
+
+
+async def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print(" RESPONSE CACHE TESTS ")
+    print("=" * 60)
+
+    try:
+        await test_make_key()
+        await test_ttl_expiry()
+        await test_temperature_gating()
+
+        print("\n" + "=" * 60)
+        print(" ALL TESTS PASSED! ")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n[ERROR] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    result = asyncio.run(main())
+    sys.exit(result)
@@ -0,0 +1,156 @@
+"""
+ScenarioSheet state tracking tests.
+
+Checks that the consistency hash always matches a hash of a fresh copy, and
+that serialized() never returns a stale dump, including after nested
+in-place edits.
+"""
+
+import asyncio
+import sys
+
+# Configure stdout for unicode support on Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# Add parent to path for imports
+sys.path.insert(0, str(__file__).rsplit("\\", 2)[0])
+
+
+def _full_hash(sheet):
+    """Hash a fresh copy of the sheet."""
+    from backend.lib.models import ScenarioSheet
+
+    return ScenarioSheet.model_validate(sheet.model_dump())._compute_hash()
+
+
+def _make_sheet():
+    from backend.lib.models import (
+        CasualtyProfile,
+        ForceDescription,
+        ScenarioSheet,
+        UnitComposition,
+    )
+
+    sheet = ScenarioSheet(
+        forces={
+            "side_a": ForceDescription(
+                side_name="Side A",
+                total_strength=900,
+                composition=[
+                    UnitComposition(unit_type="infantry", count=600),
+                    UnitComposition(unit_type="cavalry", count=400),
+                ],
+            ),
+        },
+        casualty_profile=CasualtyProfile(winner_casualties_percent=140.0),
+    )
+    sheet.increment_version("init")
+    return sheet
+
+
+async def test_hash_after_nested_edit():
+    """Test hash tracking when nested values are edited in place."""
+    print("\n" + "=" * 60)
+    print("TEST: Hash After Nested Edit")
+    print("=" * 60)
+
+    sheet = _make_sheet()
+    assert sheet.consistency_hash == _full_hash(sheet)
+
+    before = sheet.consistency_hash
+    sheet.forces["side_a"].side_name = "Renamed"
+    sheet.increment_version("test")
+    assert sheet.consistency_hash == _full_hash(sheet)
+    assert sheet.consistency_hash != before
+    print("[OK] In-place edit of a nested model is picked up")
+
+    sheet.version = 42
+    sheet.increment_version("test")
+    assert sheet.consistency_hash == _full_hash(sheet)
+    print("[OK] Scalar assignment is picked up")
+
+
+async def test_serialized_after_nested_edit():
+    """Test that serialized() reflects nested edits within one version."""
+    print("\n" + "=" * 60)
+    print("TEST: Serialized After Nested Edit")
+    print("=" * 60)
+
+    import json
+
+    sheet = _make_sheet()
+    before = sheet.serialized()
+    assert "consistency_hash" not in json.loads(before)
+
+    # Same version, nested edit only
+    sheet.forces["side_a"].side_name = "Renamed"
+    after = sheet.serialized()
+    assert after != before
+    assert json.loads(after)["forces"]["side_a"]["side_name"] == "Renamed"
+    assert sheet.canonical_json() == after.decode()
+    print("[OK] Nested edit is visible without a version bump")
+
+
+async def test_hash_after_auto_resolution():
+    """Test hash tracking through the moderator's auto-resolvers."""
+    print("\n" + "=" * 60)
+    print("TEST: Hash After Auto-Resolution")
+    print("=" * 60)
+
+    from backend.lib.models import ConsistencyViolation
+    from backend.moderator.consistency import resolve_contradictions
+
+    sheet = _make_sheet()
+    violations = [
+        ConsistencyViolation(
+            field="forces.side_a",
+            violation_type="force_count_mismatch",
+            description="mismatch",
+            severity="error",
+        ),
+        ConsistencyViolation(
+            field="casualty_profile.winner_casualties_percent",
+            violation_type="invalid_percentage",
+            description="over 100",
+            severity="error",
+        ),
+    ]
+
+    resolved, resolutions = await resolve_contradictions(sheet, violations)
+    assert len(resolutions) == 2, resolutions
+    assert resolved.forces["side_a"].total_strength == 1000
+    assert resolved.casualty_profile.winner_casualties_percent == 100.0
+
+    resolved.increment_version("moderator")
+    assert resolved.consistency_hash == _full_hash(resolved)
+    assert resolved.consistency_hash != sheet.consistency_hash
+    print(f"[OK] {len(resolutions)} resolutions, hash matches full recompute")
+
+
+async def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print(" SCENARIO SHEET TESTS ")
+    print("=" * 60)
+
+    try:
+        await test_hash_after_nested_edit()
+        await test_serialized_after_nested_edit()
+        await test_hash_after_auto_resolution()
+
+        print("\n" + "=" * 60)
+        print(" ALL TESTS PASSED! ")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n[ERROR] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    result = asyncio.run(main())
+    sys.exit(result)
@@ -0,0 +1,147 @@
+"""
+SSE framing and token usage tests.
+
+Checks the byte-level SSE frames sent to EventSource clients and that
+TokenUsage totals survive accumulation and serialization.
+"""
+
+import asyncio
+import json
+import sys
+
+# Configure stdout for unicode support on Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# Add parent to path for imports
+sys.path.insert(0, str(__file__).rsplit("\\", 2)[0])
+
+
+def _parse_frame(frame: bytes) -> dict[str, str]:
+    """Split one SSE frame into its fields; asserts it is well formed."""
+    assert isinstance(frame, bytes)
+    assert frame.endswith(b"\n\n") and frame.count(b"\n\n") == 1
+    fields = {}
+    for line in frame[:-2].decode("utf-8").split("\n"):
+        name, _, value = line.partition(": ")
+        assert name not in fields, f"duplicate field {name}"
+        fields[name] = value
+    return fields
+
+
+async def test_format_sse():
+    """Test SSEEvent framing via format_sse."""
+    print("\n" + "=" * 60)
+    print("TEST: SSE Framing")
+    print("=" * 60)
+
+    from backend.lib.models import SSEEvent, TokenUsage
+    from backend.lib.streaming import format_sse
+
+    event = SSEEvent(
+        sequence=7,
+        event_type="expert_contribution",
+        data={"text": "Hold the ford\nuntil dusk", "expert": "tactician"},
+        sheet_version=3,
+        sheet_hash="abc123",
+        token_usage=TokenUsage(input_tokens=10, output_tokens=5),
+    )
+
+    frame = format_sse(event)
+    assert frame == event.sse_payload()
+    fields = _parse_frame(frame)
+
+    # Only id and data; no 'event' field, or EventSource.onmessage misses it
+    assert list(fields) == ["id", "data"]
+    assert fields["id"] == "7"
+    print("[OK] Frame is id + single data line, terminated by a blank line")
+
+    payload = json.loads(fields["data"])
+    assert payload["sequence"] == 7
+    assert payload["event_type"] == "expert_contribution"
+    assert payload["data"]["text"] == "Hold the ford\nuntil dusk"
+    assert payload["sheet_version"] == 3
+    assert payload["sheet_hash"] == "abc123"
+    assert payload["token_usage"]["total_tokens"] == 15
+    assert payload == json.loads(json.dumps(event.to_dict()))
+    print("[OK] Data line decodes to the event's fields")
+
+
+async def test_format_sse_simple():
+    """Test framing of ad-hoc events."""
+    print("\n" + "=" * 60)
+    print("TEST: Simple SSE Framing")
+    print("=" * 60)
+
+    from backend.lib.streaming import format_sse_simple
+
+    fields = _parse_frame(format_sse_simple("status", {"round": 2}))
+    assert list(fields) == ["data"]
+    assert json.loads(fields["data"]) == {"event_type": "status", "data": {"round": 2}}
+    print("[OK] Simple frame carries event_type and data")
+
+
+async def test_token_usage():
+    """Test TokenUsage accumulation and round-trips."""
+    print("\n" + "=" * 60)
+    print("TEST: Token Usage")
+    print("=" * 60)
+
+    from backend.lib.models import DeliberationRound, TokenUsage
+
+    usage = TokenUsage(input_tokens=100, output_tokens=50, model="claude")
+    assert usage.total_tokens == 150
+
+    same = usage
+    usage += TokenUsage(
+        input_tokens=20, output_tokens=10, cache_read_tokens=80, cache_creation_tokens=5
+    )
+    assert usage is same
+    assert (usage.input_tokens, usage.output_tokens) == (120, 60)
+    assert (usage.cache_read_tokens, usage.cache_creation_tokens) == (80, 5)
+    assert usage.total_tokens == 180
+    assert usage.model == "claude"
+    print("[OK] += accumulates in place and keeps total_tokens in step")
+
+    as_dict = usage.to_dict()
+    assert as_dict["total_tokens"] == 180
+    assert TokenUsage(**{k: v for k, v in as_dict.items() if k != "total_tokens"}) == usage
+
+    round_ = DeliberationRound(round_number=1, token_usage=usage)
+    restored = DeliberationRound.model_validate_json(round_.model_dump_json())
+    assert restored.token_usage == usage
+    print("[OK] Survives to_dict and JSON round-trips")
+
+    # total_tokens is derived; a stale stored value is recomputed
+    stale = {"input_tokens": 1, "output_tokens": 2, "total_tokens": 99}
+    restored = DeliberationRound.model_validate({"round_number": 1, "token_usage": stale})
+    assert restored.token_usage.total_tokens == 3
+    print("[OK] total_tokens recomputed on load")
+
+
+async def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print(" STREAMING TESTS ")
+    print("=" * 60)
+
+    try:
+        await test_format_sse()
+        await test_format_sse_simple()
+        await test_token_usage()
+
+        print("\n" + "=" * 60)
+        print(" ALL TESTS PASSED! ")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n[ERROR] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    result = asyncio.run(main())
+    sys.exit(result)